@@ -1,14 +1,51 @@
 """JEC-API: Define FastAPI routes as classes."""
 
-from .route import Route
-from .core import Core
-from .decorator import log, speed, version, auth, deprecated, ratelimit, timeout, retry, cache, cache_invalidate
-from .dev.dev_console import DevConsoleStore, get_store
- 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .route import Route
+    from .core import Core
+    from .decorator import log, speed, version, auth, deprecated, ratelimit, timeout, retry, cache, cache_invalidate, cache_invalidate_prefix
+    from .dev.dev_console import DevConsoleStore, get_store
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package, e.g. for the `jec` CLI, does not pull in FastAPI and every decorator.
+_LAZY_ATTRS = {
+    "Route": ".route",
+    "Core": ".core",
+    "log": ".decorator",
+    "speed": ".decorator",
+    "version": ".decorator",
+    "auth": ".decorator",
+    "deprecated": ".decorator",
+    "ratelimit": ".decorator",
+    "timeout": ".decorator",
+    "retry": ".decorator",
+    "cache": ".decorator",
+    "cache_invalidate": ".decorator",
+    "cache_invalidate_prefix": ".decorator",
+    "DevConsoleStore": ".dev.dev_console",
+    "get_store": ".dev.dev_console",
+}
+
 __all__ = [
-    "Route", "Core", 
-    "log", "speed", "version", "auth", 
-    "deprecated", "ratelimit", "timeout", "retry", "cache", "cache_invalidate",
+    "Route", "Core",
+    "log", "speed", "version", "auth",
+    "deprecated", "ratelimit", "timeout", "retry", "cache", "cache_invalidate", "cache_invalidate_prefix",
     "DevConsoleStore", "get_store"
 ]
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
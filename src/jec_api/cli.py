@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib
 import json
+import re
 from dataclasses import asdict, dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .core import Core
 from .discovery import discover_routes
 
+if TYPE_CHECKING:
+    from .core import Core
+
 
 @dataclass
 class Finding:
@@ -23,6 +27,25 @@ class Finding:
 
 SEVERITY_RANK = {"info": 1, "warning": 2, "error": 3}
 
+_WRITE_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+_SLOW_NAME_RE = re.compile(r"report|export|sync")
+
+_MSG_JEC001 = "Duplicate route collision detected for %s %s."
+_FIX_JEC001 = "Rename or move one of the colliding endpoints so each method+path pair is unique."
+_MSG_JEC014 = "Write endpoint has no authentication decorator."
+_FIX_JEC014 = "Add @auth(...) to protect this endpoint, or explicitly use @auth(False) if intended."
+_MSG_JEC031 = "Potentially slow endpoint has no timeout decorator."
+_FIX_JEC031 = "Add @timeout(seconds=...) with an endpoint-appropriate maximum runtime."
+_MSG_JEC042 = "GET endpoint does not declare a cache strategy."
+_FIX_JEC042 = "Consider adding @cache(ttl=...) where safe to reduce latency and server load."
+_MSG_JEC022 = "Standard error envelope is disabled."
+_FIX_JEC022 = "Enable app.tinker(error_envelope=True) to keep client-side error handling consistent."
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_slow_name(name: str) -> bool:
+    return _SLOW_NAME_RE.search(name.lower()) is not None
+
 
 def _load_app_from_target(target: str) -> Core | None:
     if ":" not in target:
@@ -30,81 +53,46 @@ def _load_app_from_target(target: str) -> Core | None:
     module_name, app_name = target.split(":", 1)
     module = importlib.import_module(module_name)
     app = getattr(module, app_name, None)
+    # Imported here so the CLI does not load FastAPI unless an app is checked
+    from .core import Core
     return app if isinstance(app, Core) else None
 
 
 def run_doctor(package: str = "routes", app_target: str | None = None) -> list[Finding]:
-    findings: list[Finding] = []
+    # Rows are (id, severity, location, message, fix), turned into Finding objects at the end.
+    rows: list[tuple[str, str, str, str, str]] = []
+    append = rows.append
 
     routes = discover_routes(package, recursive=True)
     seen: set[tuple[str, str]] = set()
 
     for route_class in routes:
         base_path = route_class.get_path()
+        class_name = route_class.__name__
         for method, sub_path, fn, _, _ in route_class.get_endpoints():
             full_path = base_path if sub_path == "/" else base_path.rstrip("/") + sub_path
             key = (method, full_path)
-            location = f"{route_class.__name__}.{fn.__name__}"
+            fn_name = fn.__name__
+            location = "%s.%s" % (class_name, fn_name)
 
             if key in seen:
-                findings.append(
-                    Finding(
-                        id="JEC001",
-                        severity="error",
-                        location=location,
-                        message=f"Duplicate route collision detected for {method} {full_path}.",
-                        fix="Rename or move one of the colliding endpoints so each method+path pair is unique.",
-                    )
-                )
+                append(("JEC001", "error", location, _MSG_JEC001 % (method, full_path), _FIX_JEC001))
             seen.add(key)
 
-            if method in {"POST", "PUT", "PATCH", "DELETE"} and not getattr(fn, "_auth_enabled", False):
-                findings.append(
-                    Finding(
-                        id="JEC014",
-                        severity="warning",
-                        location=location,
-                        message="Write endpoint has no authentication decorator.",
-                        fix="Add @auth(...) to protect this endpoint, or explicitly use @auth(False) if intended.",
-                    )
-                )
-
-            lowered = fn.__name__.lower()
-            if any(token in lowered for token in {"report", "export", "sync"}) and not getattr(fn, "_timeout", False):
-                findings.append(
-                    Finding(
-                        id="JEC031",
-                        severity="warning",
-                        location=location,
-                        message="Potentially slow endpoint has no timeout decorator.",
-                        fix="Add @timeout(seconds=...) with an endpoint-appropriate maximum runtime.",
-                    )
-                )
+            if method in _WRITE_METHODS and not getattr(fn, "_auth_enabled", False):
+                append(("JEC014", "warning", location, _MSG_JEC014, _FIX_JEC014))
+
+            if _is_slow_name(fn_name) and not getattr(fn, "_timeout", False):
+                append(("JEC031", "warning", location, _MSG_JEC031, _FIX_JEC031))
 
             if method == "GET" and not getattr(fn, "_cache", None):
-                findings.append(
-                    Finding(
-                        id="JEC042",
-                        severity="info",
-                        location=location,
-                        message="GET endpoint does not declare a cache strategy.",
-                        fix="Consider adding @cache(ttl=...) where safe to reduce latency and server load.",
-                    )
-                )
+                append(("JEC042", "info", location, _MSG_JEC042, _FIX_JEC042))
 
     app = _load_app_from_target(app_target) if app_target else None
     if app is not None and not getattr(app, "error_envelope", True):
-        findings.append(
-            Finding(
-                id="JEC022",
-                severity="warning",
-                location=app_target,
-                message="Standard error envelope is disabled.",
-                fix="Enable app.tinker(error_envelope=True) to keep client-side error handling consistent.",
-            )
-        )
-
-    return findings
+        append(("JEC022", "warning", app_target, _MSG_JEC022, _FIX_JEC022))
+
+    return [Finding(*row) for row in rows]
 
 
 def _print_text(findings: list[Finding]) -> None:
@@ -219,6 +219,9 @@ class Core(FastAPI):
     def _setup_dev_console(self):
         """Set up the dev console middleware and routes."""
         from .dev.dev_console import create_dev_router, get_store
+        from .decorator.utils import enable_dev_store
+        
+        enable_dev_store()
         
         # Add request tracking middleware
         @self.middleware("http")
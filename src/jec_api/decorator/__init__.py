@@ -6,7 +6,7 @@ from .retry import retry
 from .speed import speed
 from .timeout import timeout
 from .version import version
-from .cache import cache, invalidate as cache_invalidate
+from .cache import cache, invalidate as cache_invalidate, invalidate_prefix as cache_invalidate_prefix
 
 __all__ = [
     "auth",
@@ -19,4 +19,5 @@ __all__ = [
     "version",
     "cache",
     "cache_invalidate",
+    "cache_invalidate_prefix",
 ]
@@ -4,11 +4,38 @@ import inspect
 from typing import Callable, Any, List, Optional
 from inspect import Parameter
 
-from fastapi import Request, HTTPException
 from .utils import get_dev_store, find_request, is_async
 
 logger = logging.getLogger("jec_api")
 
+# Whether each registered auth handler accepts (request, roles, scopes, require_all)
+# or only the legacy (request, roles) form. Probed once per handler.
+_handler_accepts_scopes: dict = {}
+
+
+def _accepts_scopes(auth_handler: Callable) -> bool:
+    """Return True if the handler takes the full (request, roles, scopes, require_all) form."""
+    try:
+        return _handler_accepts_scopes[auth_handler]
+    except KeyError:
+        pass
+    try:
+        params = inspect.signature(auth_handler).parameters.values()
+    except (TypeError, ValueError):
+        accepts = True
+    else:
+        positional = 0
+        for param in params:
+            if param.kind is Parameter.VAR_POSITIONAL:
+                accepts = True
+                break
+            if param.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+                positional += 1
+        else:
+            accepts = positional >= 4
+    _handler_accepts_scopes[auth_handler] = accepts
+    return accepts
+
 
 def auth(
     enabled: bool = True,
@@ -79,17 +106,30 @@ def auth(
     _roles = roles or []
     _scopes = scopes or []
 
+    def _set_metadata(target: Callable) -> None:
+        # Store auth metadata on the function for introspection
+        target._auth_enabled = enabled
+        target._auth_roles = _roles
+        target._auth_scopes = _scopes
+        target._auth_require_all = require_all
+
     def decorator(func: Callable) -> Callable:
+        if not enabled:
+            # Nothing to enforce, so skip the signature work and leave the endpoint as-is
+            _set_metadata(func)
+            return func
+
+        # FastAPI is imported when the decorator is applied, not when the module loads
+        from fastapi import Request, HTTPException
+
         # Inspect the original function signature to handle 'request' injection
         sig = inspect.signature(func)
-        params = list(sig.parameters.values())
-        
-        request_param_present = False
-        for param in params:
-            if param.name == "request" or param.annotation == Request:
-                request_param_present = True
-                break
+        request_param_present = "request" in sig.parameters or any(
+            param.annotation is Request for param in sig.parameters.values()
+        )
         
+        func_is_async = is_async(func)
+
         def _get_error_message():
             if custom_error:
                 return custom_error
@@ -99,7 +139,7 @@ def auth(
         async def async_wrapper(*args, **kwargs) -> Any:
             request = find_request(args, kwargs)
             
-            if enabled and request:
+            if request:
                 # Get the auth handler from the app
                 auth_handler = getattr(request.app, "auth_handler", None)
                 
@@ -113,11 +153,10 @@ def auth(
                 
                 # Call the handler validation with roles and scopes
                 try:
-                    # Try to call with both roles and scopes (new signature)
-                    try:
+                    if _accepts_scopes(auth_handler):
                         result = await auth_handler(request, _roles, _scopes, require_all)
-                    except TypeError:
-                        # Fall back to old signature (just roles)
+                    else:
+                        # Old handler signature (just roles)
                         result = await auth_handler(request, _roles)
                     
                     if result is False:
@@ -136,71 +175,26 @@ def auth(
             if not request_param_present and 'request' in kwargs:
                 kwargs.pop('request')
                 
-            return await func(*args, **kwargs)
-
-        @functools.wraps(func)
-        def sync_wrapper(*args, **kwargs) -> Any:
-            request = find_request(args, kwargs)
-            
-            if enabled and request:
-                auth_handler = getattr(request.app, "auth_handler", None)
-                
-                if not auth_handler:
-                    logger.error(f"[AUTH] No auth handler registered for {func.__qualname__}")
-                    raise HTTPException(
-                        status_code=500, 
-                        detail="Authentication is enabled but no handler is configured."
-                    )
-                
-                try:
-                    # For sync context, we still need to handle async auth handler
-                    import asyncio
-                    try:
-                        result = asyncio.get_event_loop().run_until_complete(
-                            auth_handler(request, _roles, _scopes, require_all)
-                        )
-                    except TypeError:
-                        result = asyncio.get_event_loop().run_until_complete(
-                            auth_handler(request, _roles)
-                        )
-                    
-                    if result is False:
-                        raise HTTPException(status_code=403, detail=_get_error_message())
-                except HTTPException as e:
-                    store = get_dev_store()
-                    if store:
-                        store.add_log("error", func.__qualname__, f"AUTH FAILED: {str(e)}")
-                    raise e
-                except Exception as e:
-                    logger.error(f"[AUTH] Error in auth handler: {e}")
-                    raise HTTPException(status_code=500, detail="Internal authentication error")
-
-            if not request_param_present and 'request' in kwargs:
-                kwargs.pop('request')
-                
+            if func_is_async:
+                return await func(*args, **kwargs)
             return func(*args, **kwargs)
 
-        # We will use the async wrapper for everything because auth is likely async
-        final_wrapper = async_wrapper if is_async(func) else async_wrapper
-        
-        # Store auth metadata on the function for introspection
-        final_wrapper._auth_enabled = enabled
-        final_wrapper._auth_roles = _roles
-        final_wrapper._auth_scopes = _scopes
-        final_wrapper._auth_require_all = require_all
+        # Auth handlers are async, so the async wrapper is used for every endpoint.
+        # FastAPI awaits it either way; sync endpoints are simply called inline.
+        final_wrapper = async_wrapper
+        _set_metadata(final_wrapper)
         
         # Modify signature if request param is missing
         if not request_param_present:
-            new_params = params.copy()
-            new_params.append(
-                Parameter(
-                    "request",
-                    kind=Parameter.KEYWORD_ONLY,
-                    annotation=Request,
-                    default=None
-                )
+            request_param = Parameter(
+                "request",
+                kind=Parameter.KEYWORD_ONLY,
+                annotation=Request,
+                default=None
+            )
+            final_wrapper.__signature__ = sig.replace(
+                parameters=[*sig.parameters.values(), request_param]
             )
-            final_wrapper.__signature__ = sig.replace(parameters=new_params)
             
         return final_wrapper
 
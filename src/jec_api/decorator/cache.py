@@ -1,44 +1,187 @@
+from __future__ import annotations
+
+import bisect
+import fnmatch
 import functools
+import glob
 import hashlib
-import json
+import heapq
+import re
+import string
 import time
-from dataclasses import dataclass
-from fnmatch import fnmatch
-from typing import Any, Callable, Optional
-
-from fastapi import Request
-from fastapi.responses import JSONResponse, Response
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from .utils import find_request, is_async
 
+if TYPE_CHECKING:
+    from fastapi import Request
+    from fastapi.responses import Response
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+# FastAPI response classes are imported on first use so that importing the
+# decorator (e.g. for `jec doctor` metadata checks) does not load FastAPI.
+_JSONResponse = None
+_Response = None
+
+
+def _response_classes() -> tuple:
+    global _JSONResponse, _Response
+    if _JSONResponse is None:
+        from fastapi.responses import JSONResponse, Response
+
+        _JSONResponse, _Response = JSONResponse, Response
+    return _JSONResponse, _Response
+
+
+_ETAG_HASHES = {"blake2b", "sha256", "xxh3"}
+
 
-@dataclass
 class CacheEntry:
-    value: Any
-    status_code: int
-    content_type: str
-    headers: dict[str, str]
-    expires_at: float
-    stale_until: float
-    etag: str
+    """A cached response. Uses __slots__ since a backend may hold thousands of these."""
+
+    __slots__ = ("value", "status_code", "content_type", "headers", "expires_at", "stale_until", "etag", "body")
+
+    def __init__(
+        self,
+        value: Any,
+        status_code: int,
+        content_type: str,
+        headers: dict[str, str],
+        expires_at: float,
+        stale_until: float,
+        etag: str,
+        body: Optional[bytes] = None,
+    ) -> None:
+        self.value = value
+        self.status_code = status_code
+        self.content_type = content_type
+        self.headers = headers
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.etag = etag
+        self.body = body
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheEntry(status_code={self.status_code!r}, etag={self.etag!r}, "
+            f"expires_at={self.expires_at!r}, stale_until={self.stale_until!r})"
+        )
+
+
+_GLOB_CHARS = "*?["
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the part of a glob pattern before its first wildcard."""
+    for i, ch in enumerate(pattern):
+        if ch in _GLOB_CHARS:
+            return pattern[:i]
+    return pattern
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> Callable[[str], Any]:
+    return re.compile(fnmatch.translate(pattern)).match
 
 
 class MemoryCacheBackend:
-    def __init__(self) -> None:
-        self._store: dict[str, CacheEntry] = {}
+    """Bounded in-memory LRU cache.
+
+    Entries are evicted least-recently-used first once ``maxsize`` is reached,
+    and dropped lazily once their stale window has passed. A sorted key index
+    lets glob invalidation with a literal prefix skip unrelated keys.
+    """
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self._maxsize = maxsize
+        self._store: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._expiry: list[tuple[float, str]] = []
+        self._keys: list[str] = []
 
     def get(self, key: str) -> Optional[CacheEntry]:
-        return self._store.get(key)
+        self._drop_expired(time.time())
+        entry = self._store.get(key)
+        if entry is not None:
+            self._store.move_to_end(key)
+        return entry
 
     def set(self, key: str, entry: CacheEntry) -> None:
+        if key in self._store:
+            self._store.move_to_end(key)
+        else:
+            if len(self._store) >= self._maxsize:
+                self._drop_expired(time.time())
+            if len(self._store) >= self._maxsize:
+                oldest, _ = self._store.popitem(last=False)
+                self._remove_key(oldest)
+            bisect.insort(self._keys, key)
         self._store[key] = entry
+        heapq.heappush(self._expiry, (entry.stale_until, key))
+        if len(self._expiry) > 2 * self._maxsize:
+            # Overwritten keys leave dead heap items behind; rebuild occasionally.
+            self._expiry = [(e.stale_until, k) for k, e in self._store.items()]
+            heapq.heapify(self._expiry)
 
     def invalidate(self, pattern: str) -> int:
-        keys = [k for k in self._store if fnmatch(k, pattern)]
+        prefix = _literal_prefix(pattern)
+        if prefix == pattern[:-1] and pattern.endswith("*"):
+            # "users:*" is the common case and needs no glob matching at all.
+            return self.invalidate_prefix(prefix)
+
+        if prefix:
+            start, end = self._prefix_range(prefix)
+            candidates = self._keys[start:end]
+        else:
+            candidates = list(self._store)
+
+        match = _compile_glob(pattern)
+        keys = [k for k in candidates if match(k)]
         for key in keys:
-            self._store.pop(key, None)
+            self._delete(key)
         return len(keys)
 
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Invalidate every key starting with ``prefix``."""
+        start, end = self._prefix_range(prefix)
+        store = self._store
+        for key in self._keys[start:end]:
+            del store[key]
+        del self._keys[start:end]
+        return end - start
+
+    def _prefix_range(self, prefix: str) -> tuple[int, int]:
+        keys = self._keys
+        start = end = bisect.bisect_left(keys, prefix)
+        size = len(keys)
+        while end < size and keys[end].startswith(prefix):
+            end += 1
+        return start, end
+
+    def _drop_expired(self, now: float) -> None:
+        heap = self._expiry
+        while heap and heap[0][0] <= now:
+            _, key = heapq.heappop(heap)
+            entry = self._store.get(key)
+            if entry is not None and entry.stale_until <= now:
+                self._delete(key)
+
+    def _delete(self, key: str) -> None:
+        if self._store.pop(key, None) is not None:
+            self._remove_key(key)
+
+    def _remove_key(self, key: str) -> None:
+        i = bisect.bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+
 
 _global_cache_backend = MemoryCacheBackend()
 
@@ -52,37 +195,63 @@ def get_cache_backend() -> Any:
     return _global_cache_backend
 
 
-def _canonical_query(request: Request) -> str:
-    items = sorted((k, v) for k, v in request.query_params.multi_items())
-    return "&".join(f"{k}={v}" for k, v in items)
-
-
-def _default_key(func_name: str, request: Request, vary: list[str]) -> str:
-    pieces = [request.method.upper(), request.url.path, _canonical_query(request), func_name]
-    for item in vary:
-        if item == "query":
-            continue
-        if item.startswith("headers:"):
-            header_name = item.split(":", 1)[1]
-            pieces.append(f"h:{header_name}={request.headers.get(header_name, '')}")
-    return "|".join(pieces)
-
-
-def _compute_etag(payload: Any) -> str:
-    if isinstance(payload, (dict, list)):
-        raw = json.dumps(payload, sort_keys=True, default=str)
-    else:
-        raw = str(payload)
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+def _default_key(func_name: str, request: Request, vary_headers: list[str]) -> str:
+    # Method and path stay readable so glob invalidation ("GET|/users*") keeps
+    # working; the query string, handler and vary headers are folded into a digest.
+    h = hashlib.blake2b(func_name.encode("utf-8"), digest_size=16)
+    for k, v in sorted(request.query_params.multi_items()):
+        h.update(b"\x00")
+        h.update(k.encode("utf-8"))
+        h.update(b"\x01")
+        h.update(v.encode("utf-8"))
+    for header_name in vary_headers:
+        h.update(b"\x02")
+        h.update(request.headers.get(header_name, "").encode("utf-8"))
+    return f"{request.method.upper()}|{request.url.path}|{h.hexdigest()}"
+
+
+def _compute_etag(body: bytes, etag_hash: str = "blake2b") -> str:
+    """Hash the rendered response body into a 32-character ETag."""
+    if etag_hash == "xxh3":
+        return xxhash.xxh3_128_hexdigest(body)
+    if etag_hash == "sha256":
+        return hashlib.sha256(body).hexdigest()[:32]
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header (possibly a list, weak or unquoted) against an ETag."""
+    bare = etag.strip('"')
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == bare:
+            return True
+    return False
 
 
 def _build_response_from_entry(entry: CacheEntry, request: Request) -> Response:
-    if request.headers.get("if-none-match") == entry.etag:
+    JSONResponse, Response = _response_classes()
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and (if_none_match == entry.etag or _etag_matches(if_none_match, entry.etag)):
         return Response(status_code=304, headers={"ETag": entry.etag})
 
-    response = JSONResponse(content=entry.value, status_code=entry.status_code)
-    for k, v in entry.headers.items():
-        response.headers[k] = v
+    if entry.body is not None:
+        # Serve the bytes rendered on the original miss instead of re-encoding;
+        # an empty body is a valid rendering too.
+        response = Response(
+            content=entry.body,
+            status_code=entry.status_code,
+            headers=entry.headers,
+            media_type=entry.content_type,
+        )
+    else:
+        response = JSONResponse(content=entry.value, status_code=entry.status_code)
+        for k, v in entry.headers.items():
+            response.headers[k] = v
     response.headers["ETag"] = entry.etag
     response.headers.setdefault("Cache-Control", "public")
     return response
@@ -96,42 +265,96 @@ def cache(
     stale_while_revalidate: int = 0,
     backend: str = "memory",
     cache_errors: bool = False,
+    etag_hash: str = "blake2b",
 ) -> Callable:
     """Cache decorator for endpoint responses."""
     if ttl < 0:
         raise ValueError("ttl must be >= 0")
+    if etag_hash not in _ETAG_HASHES:
+        raise ValueError(f"etag_hash must be one of {sorted(_ETAG_HASHES)}")
+    if etag_hash == "xxh3" and xxhash is None:
+        raise ValueError("etag_hash='xxh3' requires the xxhash package")
 
     vary = vary or ["query"]
 
+    # Everything derived from the decorator arguments is resolved once here
+    # rather than on every request.
+    vary_header = ", ".join(vary)
+    vary_headers = [item.split(":", 1)[1] for item in vary if item.startswith("headers:")]
+    cache_control = f"public, max-age={ttl}, stale-while-revalidate={stale_while_revalidate}"
+    key_fields = set()
+    if key:
+        for _, field_name, _, _ in string.Formatter().parse(key):
+            if field_name:
+                key_fields.add(field_name.split(".", 1)[0].split("[", 1)[0])
+    wants_path = "path" in key_fields
+    wants_method = "method" in key_fields
+    # {h_x_api_key} -> ("h_x_api_key", "x-api-key", "x_api_key"): looked up directly
+    # instead of walking every request header.
+    header_fields = [
+        (name, name[2:].replace("_", "-"), name[2:]) for name in key_fields if name.startswith("h_")
+    ]
+
+    metadata = {
+        "ttl": ttl,
+        "key": key,
+        "vary": vary,
+        "stale_while_revalidate": stale_while_revalidate,
+        "backend": backend,
+        "cache_errors": cache_errors,
+        "etag_hash": etag_hash,
+    }
+
     def decorator(func: Callable) -> Callable:
+        if ttl == 0:
+            # Caching is disabled: keep the endpoint as-is, only record the metadata.
+            func._cache = metadata
+            return func
+
         func_name = func.__qualname__
+        _time = time.time
 
-        async def _resolve_key(request: Request) -> str:
+        def _resolve_key(request: Request) -> str:
             if key:
-                template_data = {"path": request.url.path, "method": request.method.lower()}
-                template_data.update(request.path_params)
-                for header_name, header_value in request.headers.items():
-                    template_data[f"h_{header_name.lower().replace('-', '_')}"] = header_value
+                template_data = {}
+                if wants_path:
+                    template_data["path"] = request.url.path
+                if wants_method:
+                    template_data["method"] = request.method.lower()
+                for name, value in request.path_params.items():
+                    if name in key_fields:
+                        template_data[name] = value
+                if header_fields:
+                    headers = request.headers
+                    for field_name, header_name, raw_name in header_fields:
+                        header_value = headers.get(header_name)
+                        if header_value is None and raw_name != header_name:
+                            # Header names may legitimately contain underscores
+                            header_value = headers.get(raw_name)
+                        if header_value is not None:
+                            template_data[field_name] = header_value
                 return key.format(**template_data)
-            return _default_key(func_name, request, vary or [])
+            return _default_key(func_name, request, vary_headers)
 
         async def _execute_and_cache(*args, **kwargs):
             request = find_request(args, kwargs)
-            if request is None or ttl == 0:
+            if request is None:
                 return await func(*args, **kwargs)
 
-            active_backend = get_cache_backend() if backend == "memory" else get_cache_backend()
-            cache_key = await _resolve_key(request)
-            now = time.time()
+            # Read the module global on every call so set_cache_backend() and
+            # Core.tinker(cache_backend=...) still take effect after decoration.
+            active_backend = _global_cache_backend
+            cache_key = _resolve_key(request)
+            now = _time()
             existing = active_backend.get(cache_key)
 
-            if existing and existing.expires_at > now:
-                return _build_response_from_entry(existing, request)
-
-            if existing and existing.stale_until > now:
+            # stale_until >= expires_at by construction, so one check covers
+            # both fresh entries and those inside the stale-while-revalidate window.
+            if existing is not None and existing.stale_until > now:
                 return _build_response_from_entry(existing, request)
 
             result = await func(*args, **kwargs)
+            JSONResponse, Response = _response_classes()
 
             status_code = getattr(result, "status_code", 200)
             if not cache_errors and status_code >= 400:
@@ -144,28 +367,36 @@ def cache(
                 return result
 
             if isinstance(result, JSONResponse):
-                payload = json.loads(result.body.decode("utf-8")) if result.body else None
+                # Already rendered: reuse its bytes rather than parsing them back.
+                # The entry's body is authoritative, so value is left unset.
+                response = result
+                payload = None
             else:
+                # Render once; the same bytes feed the ETag, the response and the cache entry.
+                response = JSONResponse(content=result, status_code=status_code)
                 payload = result
 
-            etag = _compute_etag(payload)
+            body = bytes(response.body)
+            # Quoted once here, per RFC 9110, so hits can compare and send it as-is.
+            etag = f'"{_compute_etag(body, etag_hash)}"'
             entry = CacheEntry(
                 value=payload,
                 status_code=status_code,
-                content_type="application/json",
+                # An endpoint's own JSONResponse subclass may use another media type
+                content_type=response.headers.get("content-type", "application/json"),
                 headers={
-                    "Cache-Control": f"public, max-age={ttl}, stale-while-revalidate={stale_while_revalidate}",
-                    "Vary": ", ".join(vary),
+                    "Cache-Control": cache_control,
+                    "Vary": vary_header,
                 },
                 expires_at=now + ttl,
                 stale_until=now + ttl + max(stale_while_revalidate, 0),
                 etag=etag,
+                body=body,
             )
             active_backend.set(cache_key, entry)
 
-            response = JSONResponse(content=payload, status_code=status_code)
-            response.headers["Cache-Control"] = entry.headers["Cache-Control"]
-            response.headers["Vary"] = entry.headers["Vary"]
+            response.headers["Cache-Control"] = cache_control
+            response.headers["Vary"] = vary_header
             response.headers["ETag"] = etag
             return response
 
@@ -178,14 +409,7 @@ def cache(
             return func(*args, **kwargs)
 
         wrapper = async_wrapper if is_async(func) else sync_wrapper
-        wrapper._cache = {
-            "ttl": ttl,
-            "key": key,
-            "vary": vary,
-            "stale_while_revalidate": stale_while_revalidate,
-            "backend": backend,
-            "cache_errors": cache_errors,
-        }
+        wrapper._cache = metadata
         return wrapper
 
     return decorator
@@ -195,3 +419,11 @@ def invalidate(pattern: str) -> int:
     """Invalidate cache keys matching a glob pattern."""
     backend = get_cache_backend()
     return backend.invalidate(pattern)
+
+
+def invalidate_prefix(prefix: str) -> int:
+    """Invalidate cache keys starting with a literal prefix, without glob parsing."""
+    backend = get_cache_backend()
+    if hasattr(backend, "invalidate_prefix"):
+        return backend.invalidate_prefix(prefix)
+    return backend.invalidate(glob.escape(prefix) + "*")
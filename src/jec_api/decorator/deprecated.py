@@ -1,5 +1,6 @@
 import functools
 import logging
+import random
 from typing import Callable, Any, Optional, Union
 
 from fastapi import Request
@@ -16,6 +17,7 @@ def deprecated(
     message: Optional[str] = None,
     alternative: Optional[str] = None,
     sunset: Optional[str] = None,
+    sample_rate: Optional[float] = None,
 ) -> Callable:
     """
     Decorator that marks an endpoint as deprecated.
@@ -31,6 +33,8 @@ def deprecated(
         message: Custom deprecation warning message. Default: "This endpoint is deprecated"
         alternative: Suggested alternative endpoint. Default: None
         sunset: Date when endpoint will be removed (ISO 8601 format). Default: None
+        sample_rate: Fraction of calls (0.0-1.0) that log a deprecation warning.
+            Default: None, which logs only the first call per process.
     
     Response Headers Added:
         - Deprecation: true
@@ -53,8 +57,13 @@ def deprecated(
             async def put(self):
                 return {"updated": True}
     """
+    # `not 0.0 <= x <= 1.0` also rejects NaN
+    if sample_rate is not None and not 0.0 <= sample_rate <= 1.0:
+        raise ValueError("sample_rate must be between 0.0 and 1.0")
     
     def decorator(func: Callable) -> Callable:
+        func_name = func.__qualname__
+        
         # Determine the deprecation message
         dep_message = message or "This endpoint is deprecated"
         
@@ -69,6 +78,18 @@ def deprecated(
                 if dep_message:
                     result.headers["X-Deprecation-Message"] = dep_message
         
+        logged_once = False
+        
+        def _should_log() -> bool:
+            """Log the first call per process, or a random sample when sample_rate is set."""
+            nonlocal logged_once
+            if sample_rate is not None:
+                return random.random() < sample_rate
+            if logged_once:
+                return False
+            logged_once = True
+            return True
+        
         def _log_deprecation(func_name: str):
             """Log deprecation warning."""
             log_msg = f"[DEPRECATED] {func_name}: {dep_message}"
@@ -84,8 +105,8 @@ def deprecated(
         
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs) -> Any:
-            func_name = func.__qualname__
-            _log_deprecation(func_name)
+            if _should_log():
+                _log_deprecation(func_name)
             
             result = await func(*args, **kwargs)
             _add_deprecation_headers(result)
@@ -93,8 +114,8 @@ def deprecated(
         
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs) -> Any:
-            func_name = func.__qualname__
-            _log_deprecation(func_name)
+            if _should_log():
+                _log_deprecation(func_name)
             
             result = func(*args, **kwargs)
             _add_deprecation_headers(result)
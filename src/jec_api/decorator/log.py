@@ -1,5 +1,6 @@
 import functools
 import logging
+import reprlib
 from typing import Callable, Any, Optional, Union
 
 from .utils import get_dev_store, is_async, truncate
@@ -14,6 +15,13 @@ _LOG_LEVELS = {
     "error": logging.ERROR,
 }
 
+# reprlib.Repr limits; the container and nesting defaults (4-6 items)
+# would otherwise elide arguments long before max_length is reached
+_REPR_LIMITS = (
+    "maxlevel", "maxtuple", "maxlist", "maxarray", "maxdict", "maxset",
+    "maxfrozenset", "maxdeque", "maxstring", "maxlong", "maxother",
+)
+
 
 def log(
     func: Callable = None,
@@ -56,83 +64,101 @@ def log(
     def decorator(fn: Callable) -> Callable:
         log_level = _LOG_LEVELS.get(level.lower(), logging.INFO)
         prefix = f"[{message}] " if message else ""
+        func_name = fn.__qualname__
+        call_head = f"{prefix}[CALL] {func_name}"
+        return_head = f"{prefix}[RETURN] {func_name}"
+        error_head = f"{prefix}[ERROR] {func_name}"
+        # Methods drop 'self' from logged args; plain functions keep every arg.
+        # args[0:] returns the same tuple, so nothing is copied in that case.
+        qualname_parts = func_name.split(".")
+        skip_self = 1 if len(qualname_parts) > 1 and qualname_parts[-2] != "<locals>" else 0
+        # Bounded repr so large payloads are clipped while being formatted,
+        # not stringified in full and cut afterwards. Every reprlib limit is
+        # raised to max_length so that is the only bound on what gets shown.
+        arg_repr = reprlib.Repr()
+        for limit in _REPR_LIMITS:
+            setattr(arg_repr, limit, max_length)
         
-        @functools.wraps(fn)
-        async def async_wrapper(*args, **kwargs) -> Any:
-            func_name = fn.__qualname__
-            
-            # Log entry with args (excluding 'self' for cleaner output)
-            if include_args:
-                filtered_args = args[1:] if args else args  # Skip 'self'
-                log_msg = f"args={filtered_args} kwargs={kwargs}"
-                logger.log(log_level, f"{prefix}[CALL] {func_name} | {log_msg}")
-                
-                # Push to dev console if active
-                store = get_dev_store()
-                if store:
-                    store.add_log(level, func_name, f"CALL: {log_msg}", args=str(filtered_args))
-            else:
-                logger.log(log_level, f"{prefix}[CALL] {func_name}")
+        if is_async(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs) -> Any:
                 store = get_dev_store()
-                if store:
-                    store.add_log(level, func_name, "CALL")
-            
-            try:
-                result = await fn(*args, **kwargs)
-                if include_result:
-                    result_str = truncate(result, max_length)
-                    logger.log(log_level, f"{prefix}[RETURN] {func_name} | result={result_str}")
-                    store = get_dev_store()
+                log_enabled = logger.isEnabledFor(log_level)
+                
+                # Log entry with args (excluding 'self' for cleaner output)
+                if include_args:
+                    if log_enabled or store:
+                        args_str = truncate(arg_repr.repr(args[skip_self:]), max_length)  # Skip 'self'
+                        log_msg = f"args={args_str} kwargs={truncate(arg_repr.repr(kwargs), max_length)}"
+                        if log_enabled:
+                            logger.log(log_level, "%s | %s", call_head, log_msg)
+                        
+                        # Push to dev console if active
+                        if store:
+                            store.add_log(level, func_name, f"CALL: {log_msg}", args=args_str)
+                else:
+                    if log_enabled:
+                        logger.log(log_level, call_head)
                     if store:
-                        store.add_log(level, func_name, f"RETURN: {result_str}", result=result_str)
-                return result
-            except Exception as e:
-                error_msg = f"{type(e).__name__}: {e}"
-                logger.error(f"{prefix}[ERROR] {func_name} | exception={error_msg}")
-                store = get_dev_store()
-                if store:
-                    store.add_log("error", func_name, f"ERROR: {error_msg}")
-                raise
-        
-        @functools.wraps(fn)
-        def sync_wrapper(*args, **kwargs) -> Any:
-            func_name = fn.__qualname__
-            
-            if include_args:
-                filtered_args = args[1:] if args else args
-                log_msg = f"args={filtered_args} kwargs={kwargs}"
-                logger.log(log_level, f"{prefix}[CALL] {func_name} | {log_msg}")
+                        store.add_log(level, func_name, "CALL")
                 
-                store = get_dev_store()
-                if store:
-                    store.add_log(level, func_name, f"CALL: {log_msg}", args=str(filtered_args))
-            else:
-                logger.log(log_level, f"{prefix}[CALL] {func_name}")
-                store = get_dev_store()
-                if store:
-                    store.add_log(level, func_name, "CALL")
-            
-            try:
-                result = fn(*args, **kwargs)
-                if include_result:
-                    result_str = truncate(result, max_length)
-                    logger.log(log_level, f"{prefix}[RETURN] {func_name} | result={result_str}")
-                    store = get_dev_store()
+                try:
+                    result = await fn(*args, **kwargs)
+                    if include_result and (log_enabled or store):
+                        result_str = truncate(result, max_length)
+                        if log_enabled:
+                            logger.log(log_level, "%s | result=%s", return_head, result_str)
+                        if store:
+                            store.add_log(level, func_name, f"RETURN: {result_str}", result=result_str)
+                    return result
+                except Exception as e:
+                    error_msg = f"{type(e).__name__}: {e}"
+                    logger.error("%s | exception=%s", error_head, error_msg)
                     if store:
-                        store.add_log(level, func_name, f"RETURN: {result_str}", result=result_str)
-                return result
-            except Exception as e:
-                error_msg = f"{type(e).__name__}: {e}"
-                logger.error(f"{prefix}[ERROR] {func_name} | exception={error_msg}")
+                        store.add_log("error", func_name, f"ERROR: {error_msg}")
+                    raise
+            
+            wrapper = async_wrapper
+        else:
+            @functools.wraps(fn)
+            def sync_wrapper(*args, **kwargs) -> Any:
                 store = get_dev_store()
-                if store:
-                    store.add_log("error", func_name, f"ERROR: {error_msg}")
-                raise
+                log_enabled = logger.isEnabledFor(log_level)
+                
+                if include_args:
+                    if log_enabled or store:
+                        args_str = truncate(arg_repr.repr(args[skip_self:]), max_length)
+                        log_msg = f"args={args_str} kwargs={truncate(arg_repr.repr(kwargs), max_length)}"
+                        if log_enabled:
+                            logger.log(log_level, "%s | %s", call_head, log_msg)
+                        
+                        if store:
+                            store.add_log(level, func_name, f"CALL: {log_msg}", args=args_str)
+                else:
+                    if log_enabled:
+                        logger.log(log_level, call_head)
+                    if store:
+                        store.add_log(level, func_name, "CALL")
+                
+                try:
+                    result = fn(*args, **kwargs)
+                    if include_result and (log_enabled or store):
+                        result_str = truncate(result, max_length)
+                        if log_enabled:
+                            logger.log(log_level, "%s | result=%s", return_head, result_str)
+                        if store:
+                            store.add_log(level, func_name, f"RETURN: {result_str}", result=result_str)
+                    return result
+                except Exception as e:
+                    error_msg = f"{type(e).__name__}: {e}"
+                    logger.error("%s | exception=%s", error_head, error_msg)
+                    if store:
+                        store.add_log("error", func_name, f"ERROR: {error_msg}")
+                    raise
+            
+            wrapper = sync_wrapper
         
-        # Return appropriate wrapper based on function type
-        if is_async(fn):
-            return async_wrapper
-        return sync_wrapper
+        return wrapper
     
     # Handle both @log and @log(...) syntax
     if func is not None:
@@ -1,19 +1,192 @@
 import functools
 import logging
 import time
-from typing import Callable, Any, Optional, Dict
-from collections import defaultdict
+from collections import deque
+from typing import Callable, Any, NamedTuple, Optional, Dict, Tuple
 
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
-from .utils import get_dev_store, find_request, is_async
+from .utils import get_dev_store, request_finder, is_async
 
 logger = logging.getLogger("jec_api")
 
-# In-memory rate limit storage
-# Structure: {key: [(timestamp, count), ...]}
-_rate_limit_store: Dict[str, list] = defaultdict(list)
+
+class _RateLimitMeta(NamedTuple):
+    """Rate limit configuration exposed as `wrapper._ratelimit`."""
+    limit: int
+    window: int
+    by: str
+    strategy: str
+
+
+# Both stores are split into shards selected by hash(key) so no single dict
+# grows to millions of keys; resizes and idle sweeps stay shard-sized.
+_NUM_SHARDS = 64  # Must be a power of two
+_SHARD_MASK = _NUM_SHARDS - 1
+
+# In-memory token buckets, refilled lazily on each request.
+# Structure per shard: {key: [tokens_milli, last_refill_ns, window_ns]}
+# Tokens are kept as integer millitokens so refill math never needs floats.
+_rate_limit_store: Tuple[Dict[str, list], ...] = tuple({} for _ in range(_NUM_SHARDS))
+
+# Request timestamps for strategy="sliding_window", oldest first.
+# Structure per shard: {key: [deque([timestamp_ns, ...]), window_ns]}
+_sliding_window_store: Tuple[Dict[str, list], ...] = tuple({} for _ in range(_NUM_SHARDS))
+
+_STRATEGIES = ("token_bucket", "sliding_window")
+
+_NS_PER_SECOND = 1_000_000_000
+# Monotonic integer clock: immune to wall-clock jumps, no float math
+_monotonic_ns = time.monotonic_ns
+_TOKEN_SCALE = 1000
+
+# A shard is swept for idle keys every this many new keys inserted into it.
+_SWEEP_EVERY = 256
+_bucket_inserts = [0] * _NUM_SHARDS
+_window_inserts = [0] * _NUM_SHARDS
+
+
+def _sweep_idle_buckets(shard: Dict[str, list], now_ns: int) -> None:
+    """Drop buckets that have been idle long enough to be completely refilled."""
+    idle = [k for k, b in shard.items() if now_ns - b[1] >= b[2]]
+    for key in idle:
+        del shard[key]
+
+
+def _sweep_idle_windows(shard: Dict[str, list], now_ns: int) -> None:
+    """Drop sliding windows whose newest request has already expired."""
+    idle = [k for k, (timestamps, window_ns) in shard.items()
+            if not timestamps or now_ns - timestamps[-1] >= window_ns]
+    for key in idle:
+        del shard[key]
+
+
+def _get_rate_limit_key(request: Optional[Request], func_name: str, by: str) -> str:
+    """Generate rate limit key based on 'by' parameter."""
+    if by == "global":
+        return f"global:{func_name}"
+    elif by == "user":
+        # Try to get user ID from request state or auth header
+        if request and hasattr(request, 'state') and hasattr(request.state, 'user'):
+            user_id = getattr(request.state.user, 'id', None) or request.state.user.get('id', 'unknown')
+            return f"user:{user_id}:{func_name}"
+        elif request:
+            # Fall back to auth header hash
+            auth = request.headers.get("Authorization", "anonymous")
+            return f"user:{hash(auth)}:{func_name}"
+        return f"user:anonymous:{func_name}"
+    else:  # by == "ip"
+        if request and request.client:
+            return f"ip:{request.client.host}:{func_name}"
+        return f"ip:unknown:{func_name}"
+
+
+def _check_token_bucket(capacity: int, window_ns: int, key: str) -> tuple[bool, int, int]:
+    """
+    Take one token from the key's bucket.
+    Returns: (is_allowed, remaining, reset_seconds)
+    """
+    now_ns = _monotonic_ns()
+    index = hash(key) & _SHARD_MASK
+    shard = _rate_limit_store[index]
+    bucket = shard.get(key)
+    if bucket is None:
+        _bucket_inserts[index] += 1
+        if _bucket_inserts[index] >= _SWEEP_EVERY:
+            _bucket_inserts[index] = 0
+            _sweep_idle_buckets(shard, now_ns)
+        bucket = shard[key] = [capacity, now_ns, window_ns]
+    
+    # Lazy refill: `limit` tokens per `window` seconds, capped at `limit`.
+    # Only the time converted into whole millitokens is consumed; the
+    # remainder carries over so frequent polling still refills the bucket.
+    refill = (now_ns - bucket[1]) * capacity // window_ns
+    tokens = bucket[0] + refill
+    if tokens >= capacity:
+        tokens = capacity
+        bucket[1] = now_ns
+    else:
+        bucket[1] += refill * window_ns // capacity
+    
+    if tokens < _TOKEN_SCALE:
+        bucket[0] = tokens
+        # Seconds until one whole token is available again
+        wait_ns = -(-(_TOKEN_SCALE - tokens) * window_ns // capacity)
+        return False, 0, max(1, -(-wait_ns // _NS_PER_SECOND))
+    
+    tokens -= _TOKEN_SCALE
+    bucket[0] = tokens
+    # Seconds until the bucket is full again
+    wait_ns = -(-(capacity - tokens) * window_ns // capacity)
+    return True, tokens // _TOKEN_SCALE, max(1, -(-wait_ns // _NS_PER_SECOND))
+
+
+def _check_sliding_window(limit: int, window_ns: int, key: str) -> tuple[bool, int, int]:
+    """
+    Count the key's requests in the last `window` seconds.
+    Returns: (is_allowed, remaining, reset_seconds)
+    """
+    now_ns = _monotonic_ns()
+    window_start = now_ns - window_ns
+    index = hash(key) & _SHARD_MASK
+    shard = _sliding_window_store[index]
+    entry = shard.get(key)
+    if entry is None:
+        _window_inserts[index] += 1
+        if _window_inserts[index] >= _SWEEP_EVERY:
+            _window_inserts[index] = 0
+            _sweep_idle_windows(shard, now_ns)
+        entry = shard[key] = [deque(), window_ns]
+    timestamps = entry[0]
+    
+    # Timestamps are appended in order, so expired ones sit at the head
+    while timestamps and timestamps[0] <= window_start:
+        timestamps.popleft()
+    
+    if len(timestamps) >= limit:
+        # Seconds until the oldest counted request leaves the window
+        return False, 0, max(1, -(-(timestamps[0] - window_start) // _NS_PER_SECOND))
+    
+    timestamps.append(now_ns)
+    return True, limit - len(timestamps), max(1, -(-(timestamps[0] - window_start) // _NS_PER_SECOND))
+
+
+def _add_rate_limit_headers(result: Any, limit_str: str, remaining: int, reset_seconds: int):
+    """Add rate limit headers to response."""
+    if hasattr(result, 'headers'):
+        result.headers["X-RateLimit-Limit"] = limit_str
+        result.headers["X-RateLimit-Remaining"] = str(remaining)
+        result.headers["X-RateLimit-Reset"] = str(reset_seconds)
+
+
+@functools.lru_cache(maxsize=256)
+def _rejected_body(message: Optional[str], reset_seconds: int) -> bytes:
+    # The 429 body only varies with the message and reset_seconds, so each
+    # distinct pair is serialized once and reused for every rejection.
+    error_msg = message or f"Rate limit exceeded. Try again in {reset_seconds} seconds."
+    return JSONResponse(
+        content={
+            "error": "Too Many Requests",
+            "detail": error_msg,
+            "retry_after": reset_seconds
+        }
+    ).body
+
+
+def _rejected_response(message: Optional[str], limit_str: str, reset_seconds: int) -> Response:
+    reset_str = str(reset_seconds)
+    return Response(
+        content=_rejected_body(message, reset_seconds),
+        status_code=429,
+        media_type="application/json",
+        headers={
+            "Retry-After": reset_str,
+            "X-RateLimit-Limit": limit_str,
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": reset_str,
+        },
+    )
 
 
 def ratelimit(
@@ -23,10 +196,16 @@ def ratelimit(
     window: int = 60,
     by: str = "ip",
     message: Optional[str] = None,
+    strategy: str = "token_bucket",
 ) -> Callable:
     """
     Decorator that applies rate limiting to an endpoint.
     
+    By default each key gets a token bucket holding up to `limit` tokens that
+    refills at `limit` tokens per `window` seconds, so bursts up to `limit` are
+    allowed and the sustained rate matches the configured window. Use
+    strategy="sliding_window" to count requests in an exact rolling window.
+    
     Can be used with or without configuration:
         @ratelimit  # Default: 100 req/min per IP
         @ratelimit(limit=10, window=60)  # 10 req/min
@@ -37,11 +216,13 @@ def ratelimit(
         window: Time window in seconds. Default: 60
         by: Rate limit key - "ip", "user", or "global". Default: "ip"
         message: Custom 429 error message. Default: None
+        strategy: "token_bucket" or "sliding_window". Default: "token_bucket"
     
     Response Headers Added:
         - X-RateLimit-Limit: Maximum requests allowed
-        - X-RateLimit-Remaining: Requests remaining in current window
-        - X-RateLimit-Reset: Seconds until window resets
+        - X-RateLimit-Remaining: Requests that can be made immediately
+        - X-RateLimit-Reset: Seconds until the bucket is full again
+          (sliding window: until the oldest counted request expires)
     
     Usage:
         class Users(Route):
@@ -58,146 +239,74 @@ def ratelimit(
                 return {"token": "..."}
     """
     
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    if window <= 0:
+        raise ValueError("window must be > 0")
+    if strategy not in _STRATEGIES:
+        raise ValueError(f"strategy must be one of {_STRATEGIES}, got {strategy!r}")
+    
+    capacity = limit * _TOKEN_SCALE
+    window_ns = int(window * _NS_PER_SECOND)
+    
+    if strategy == "sliding_window":
+        _check_rate_limit = functools.partial(_check_sliding_window, limit, window_ns)
+    else:
+        _check_rate_limit = functools.partial(_check_token_bucket, capacity, window_ns)
+    
     def decorator(fn: Callable) -> Callable:
-        def _get_rate_limit_key(request: Optional[Request], func_name: str) -> str:
-            """Generate rate limit key based on 'by' parameter."""
-            if by == "global":
-                return f"global:{func_name}"
-            elif by == "user":
-                # Try to get user ID from request state or auth header
-                if request and hasattr(request, 'state') and hasattr(request.state, 'user'):
-                    user_id = getattr(request.state.user, 'id', None) or request.state.user.get('id', 'unknown')
-                    return f"user:{user_id}:{func_name}"
-                elif request:
-                    # Fall back to auth header hash
-                    auth = request.headers.get("Authorization", "anonymous")
-                    return f"user:{hash(auth)}:{func_name}"
-                return f"user:anonymous:{func_name}"
-            else:  # by == "ip"
-                if request and request.client:
-                    return f"ip:{request.client.host}:{func_name}"
-                return f"ip:unknown:{func_name}"
+        func_name = fn.__qualname__
+        limit_str = str(limit)
+        ratelimit_head = f"[RATELIMIT] {func_name}"
+        find_request = request_finder(fn)
         
-        def _check_rate_limit(key: str) -> tuple[bool, int, int]:
-            """
-            Check if rate limit is exceeded.
-            Returns: (is_allowed, remaining, reset_seconds)
-            """
-            current_time = time.time()
-            window_start = current_time - window
-            
-            # Clean old entries and count recent requests
-            _rate_limit_store[key] = [
-                ts for ts in _rate_limit_store[key] 
-                if ts > window_start
-            ]
-            
-            current_count = len(_rate_limit_store[key])
-            remaining = max(0, limit - current_count - 1)
-            
-            if current_count >= limit:
-                # Calculate reset time
-                if _rate_limit_store[key]:
-                    oldest = min(_rate_limit_store[key])
-                    reset_seconds = int(oldest + window - current_time)
-                else:
-                    reset_seconds = window
-                return False, 0, max(1, reset_seconds)
-            
-            # Record this request
-            _rate_limit_store[key].append(current_time)
-            
-            # Calculate approximate reset time (when first request in window expires)
-            if _rate_limit_store[key]:
-                oldest = min(_rate_limit_store[key])
-                reset_seconds = int(oldest + window - current_time)
-            else:
-                reset_seconds = window
-            
-            return True, remaining, max(1, reset_seconds)
-        
-        def _add_rate_limit_headers(result: Any, remaining: int, reset_seconds: int):
-            """Add rate limit headers to response."""
-            if hasattr(result, 'headers'):
-                result.headers["X-RateLimit-Limit"] = str(limit)
-                result.headers["X-RateLimit-Remaining"] = str(remaining)
-                result.headers["X-RateLimit-Reset"] = str(reset_seconds)
-        
-        @functools.wraps(fn)
-        async def async_wrapper(*args, **kwargs) -> Any:
-            func_name = fn.__qualname__
-            request = find_request(args, kwargs)
-            key = _get_rate_limit_key(request, func_name)
-            
-            is_allowed, remaining, reset_seconds = _check_rate_limit(key)
-            
-            if not is_allowed:
-                error_msg = message or f"Rate limit exceeded. Try again in {reset_seconds} seconds."
-                logger.warning(f"[RATELIMIT] {func_name} | key={key} | exceeded")
+        if is_async(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                request = find_request(args, kwargs)
+                key = _get_rate_limit_key(request, func_name, by)
                 
-                store = get_dev_store()
-                if store:
-                    store.add_log("warning", func_name, f"RATELIMIT EXCEEDED: {key}")
+                is_allowed, remaining, reset_seconds = _check_rate_limit(key)
                 
-                response = JSONResponse(
-                    status_code=429,
-                    content={
-                        "error": "Too Many Requests",
-                        "detail": error_msg,
-                        "retry_after": reset_seconds
-                    }
-                )
-                response.headers["Retry-After"] = str(reset_seconds)
-                response.headers["X-RateLimit-Limit"] = str(limit)
-                response.headers["X-RateLimit-Remaining"] = "0"
-                response.headers["X-RateLimit-Reset"] = str(reset_seconds)
-                return response
-            
-            result = await fn(*args, **kwargs)
-            _add_rate_limit_headers(result, remaining, reset_seconds)
-            return result
-        
-        @functools.wraps(fn)
-        def sync_wrapper(*args, **kwargs) -> Any:
-            func_name = fn.__qualname__
-            request = find_request(args, kwargs)
-            key = _get_rate_limit_key(request, func_name)
-            
-            is_allowed, remaining, reset_seconds = _check_rate_limit(key)
+                if not is_allowed:
+                    logger.warning("%s | key=%s | exceeded", ratelimit_head, key)
+                    
+                    store = get_dev_store()
+                    if store:
+                        store.add_log("warning", func_name, f"RATELIMIT EXCEEDED: {key}")
+                    
+                    return _rejected_response(message, limit_str, reset_seconds)
+                
+                result = await fn(*args, **kwargs)
+                _add_rate_limit_headers(result, limit_str, remaining, reset_seconds)
+                return result
             
-            if not is_allowed:
-                error_msg = message or f"Rate limit exceeded. Try again in {reset_seconds} seconds."
-                logger.warning(f"[RATELIMIT] {func_name} | key={key} | exceeded")
+            wrapper = async_wrapper
+        else:
+            @functools.wraps(fn)
+            def sync_wrapper(*args, **kwargs) -> Any:
+                request = find_request(args, kwargs)
+                key = _get_rate_limit_key(request, func_name, by)
+                
+                is_allowed, remaining, reset_seconds = _check_rate_limit(key)
                 
-                store = get_dev_store()
-                if store:
-                    store.add_log("warning", func_name, f"RATELIMIT EXCEEDED: {key}")
+                if not is_allowed:
+                    logger.warning("%s | key=%s | exceeded", ratelimit_head, key)
+                    
+                    store = get_dev_store()
+                    if store:
+                        store.add_log("warning", func_name, f"RATELIMIT EXCEEDED: {key}")
+                    
+                    return _rejected_response(message, limit_str, reset_seconds)
                 
-                response = JSONResponse(
-                    status_code=429,
-                    content={
-                        "error": "Too Many Requests",
-                        "detail": error_msg,
-                        "retry_after": reset_seconds
-                    }
-                )
-                response.headers["Retry-After"] = str(reset_seconds)
-                response.headers["X-RateLimit-Limit"] = str(limit)
-                response.headers["X-RateLimit-Remaining"] = "0"
-                response.headers["X-RateLimit-Reset"] = str(reset_seconds)
-                return response
+                result = fn(*args, **kwargs)
+                _add_rate_limit_headers(result, limit_str, remaining, reset_seconds)
+                return result
             
-            result = fn(*args, **kwargs)
-            _add_rate_limit_headers(result, remaining, reset_seconds)
-            return result
-        
-        wrapper = async_wrapper if is_async(fn) else sync_wrapper
+            wrapper = sync_wrapper
         
         # Store rate limit metadata for introspection
-        wrapper._ratelimit = True
-        wrapper._ratelimit_limit = limit
-        wrapper._ratelimit_window = window
-        wrapper._ratelimit_by = by
+        wrapper._ratelimit = _RateLimitMeta(limit, window, by, strategy)
         
         return wrapper
     
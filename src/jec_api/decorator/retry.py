@@ -1,13 +1,21 @@
 import functools
 import logging
 import asyncio
-from typing import Callable, Any, Optional, Tuple, Type
+import time
+from typing import Callable, Any, NamedTuple, Optional, Tuple, Type
 
 from .utils import get_dev_store, is_async
 
 logger = logging.getLogger("jec_api")
 
 
+class _RetryMeta(NamedTuple):
+    """Retry configuration exposed as `wrapper._retry`."""
+    attempts: int
+    delay: float
+    backoff: float
+
+
 def retry(
     func: Callable = None,
     *,
@@ -47,121 +55,139 @@ def retry(
     """
     
     def decorator(fn: Callable) -> Callable:
-        @functools.wraps(fn)
-        async def async_wrapper(*args, **kwargs) -> Any:
-            func_name = fn.__qualname__
-            last_exception = None
-            current_delay = delay
+        func_name = fn.__qualname__
+        retry_head = f"[RETRY] {func_name}"
+        
+        def _log_exhausted(e: Exception) -> None:
+            logger.error(
+                "%s | all %d attempts failed. Last error: %s", retry_head, attempts, e
+            )
             
-            for attempt in range(1, attempts + 1):
-                try:
-                    result = await fn(*args, **kwargs)
-                    
-                    # Log successful retry if this wasn't the first attempt
-                    if attempt > 1:
-                        logger.info(f"[RETRY] {func_name} | succeeded on attempt {attempt}")
-                        store = get_dev_store()
-                        if store:
-                            store.add_log("info", func_name, f"RETRY: succeeded on attempt {attempt}")
-                    
-                    return result
-                    
-                except exceptions as e:
-                    last_exception = e
-                    
-                    if attempt < attempts:
-                        logger.warning(
-                            f"[RETRY] {func_name} | attempt {attempt}/{attempts} failed: {e}. "
-                            f"Retrying in {current_delay:.2f}s..."
-                        )
+            store = get_dev_store()
+            if store:
+                store.add_log(
+                    "error", 
+                    func_name, 
+                    f"RETRY: all {attempts} attempts failed"
+                )
+        
+        if attempts <= 1:
+            # Nothing to retry: call straight through and only report the failure
+            if is_async(fn):
+                @functools.wraps(fn)
+                async def async_wrapper(*args, **kwargs) -> Any:
+                    try:
+                        return await fn(*args, **kwargs)
+                    except exceptions as e:
+                        _log_exhausted(e)
+                        raise
+                
+                wrapper = async_wrapper
+            else:
+                @functools.wraps(fn)
+                def sync_wrapper(*args, **kwargs) -> Any:
+                    try:
+                        return fn(*args, **kwargs)
+                    except exceptions as e:
+                        _log_exhausted(e)
+                        raise
+                
+                wrapper = sync_wrapper
+        elif is_async(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                last_exception = None
+                current_delay = delay
+                
+                for attempt in range(1, attempts + 1):
+                    try:
+                        result = await fn(*args, **kwargs)
                         
-                        store = get_dev_store()
-                        if store:
-                            store.add_log(
-                                "warning", 
-                                func_name, 
-                                f"RETRY: attempt {attempt}/{attempts} failed, retrying in {current_delay:.2f}s"
-                            )
+                        # Log successful retry if this wasn't the first attempt
+                        if attempt > 1:
+                            logger.info("%s | succeeded on attempt %d", retry_head, attempt)
+                            store = get_dev_store()
+                            if store:
+                                store.add_log("info", func_name, f"RETRY: succeeded on attempt {attempt}")
+                        
+                        return result
                         
-                        await asyncio.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        logger.error(
-                            f"[RETRY] {func_name} | all {attempts} attempts failed. Last error: {e}"
-                        )
+                    except exceptions as e:
+                        last_exception = e
                         
-                        store = get_dev_store()
-                        if store:
-                            store.add_log(
-                                "error", 
-                                func_name, 
-                                f"RETRY: all {attempts} attempts failed"
+                        if attempt < attempts:
+                            logger.warning(
+                                "%s | attempt %d/%d failed: %s. Retrying in %.2fs...",
+                                retry_head, attempt, attempts, e, current_delay
                             )
+                            
+                            store = get_dev_store()
+                            if store:
+                                store.add_log(
+                                    "warning", 
+                                    func_name, 
+                                    f"RETRY: attempt {attempt}/{attempts} failed, retrying in {current_delay:.2f}s"
+                                )
+                            
+                            await asyncio.sleep(current_delay)
+                            current_delay *= backoff
+                        else:
+                            _log_exhausted(e)
+                
+                # All attempts failed, raise the last exception
+                raise last_exception
             
-            # All attempts failed, raise the last exception
-            raise last_exception
-        
-        @functools.wraps(fn)
-        def sync_wrapper(*args, **kwargs) -> Any:
-            import time
-            
-            func_name = fn.__qualname__
-            last_exception = None
-            current_delay = delay
+            wrapper = async_wrapper
+        else:
+            # Sync endpoints run in FastAPI's threadpool, so sleeping between
+            # attempts blocks that worker thread rather than the event loop
+            sleep = time.sleep
             
-            for attempt in range(1, attempts + 1):
-                try:
-                    result = fn(*args, **kwargs)
-                    
-                    if attempt > 1:
-                        logger.info(f"[RETRY] {func_name} | succeeded on attempt {attempt}")
-                        store = get_dev_store()
-                        if store:
-                            store.add_log("info", func_name, f"RETRY: succeeded on attempt {attempt}")
-                    
-                    return result
-                    
-                except exceptions as e:
-                    last_exception = e
-                    
-                    if attempt < attempts:
-                        logger.warning(
-                            f"[RETRY] {func_name} | attempt {attempt}/{attempts} failed: {e}. "
-                            f"Retrying in {current_delay:.2f}s..."
-                        )
+            @functools.wraps(fn)
+            def sync_wrapper(*args, **kwargs) -> Any:
+                last_exception = None
+                current_delay = delay
+                
+                for attempt in range(1, attempts + 1):
+                    try:
+                        result = fn(*args, **kwargs)
                         
-                        store = get_dev_store()
-                        if store:
-                            store.add_log(
-                                "warning", 
-                                func_name, 
-                                f"RETRY: attempt {attempt}/{attempts} failed, retrying in {current_delay:.2f}s"
-                            )
+                        if attempt > 1:
+                            logger.info("%s | succeeded on attempt %d", retry_head, attempt)
+                            store = get_dev_store()
+                            if store:
+                                store.add_log("info", func_name, f"RETRY: succeeded on attempt {attempt}")
                         
-                        time.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        logger.error(
-                            f"[RETRY] {func_name} | all {attempts} attempts failed. Last error: {e}"
-                        )
+                        return result
                         
-                        store = get_dev_store()
-                        if store:
-                            store.add_log(
-                                "error", 
-                                func_name, 
-                                f"RETRY: all {attempts} attempts failed"
+                    except exceptions as e:
+                        last_exception = e
+                        
+                        if attempt < attempts:
+                            logger.warning(
+                                "%s | attempt %d/%d failed: %s. Retrying in %.2fs...",
+                                retry_head, attempt, attempts, e, current_delay
                             )
+                            
+                            store = get_dev_store()
+                            if store:
+                                store.add_log(
+                                    "warning", 
+                                    func_name, 
+                                    f"RETRY: attempt {attempt}/{attempts} failed, retrying in {current_delay:.2f}s"
+                                )
+                            
+                            sleep(current_delay)
+                            current_delay *= backoff
+                        else:
+                            _log_exhausted(e)
+                
+                raise last_exception
             
-            raise last_exception
-        
-        wrapper = async_wrapper if is_async(fn) else sync_wrapper
+            wrapper = sync_wrapper
         
         # Store retry metadata for introspection
-        wrapper._retry = True
-        wrapper._retry_attempts = attempts
-        wrapper._retry_delay = delay
-        wrapper._retry_backoff = backoff
+        wrapper._retry = _RetryMeta(attempts, delay, backoff)
         
         return wrapper
     
@@ -1,5 +1,6 @@
 import functools
 import logging
+import math
 import time
 from typing import Callable, Any, Optional, Union
 
@@ -44,61 +45,72 @@ def speed(
     """
     
     def decorator(fn: Callable) -> Callable:
-        @functools.wraps(fn)
-        async def async_wrapper(*args, **kwargs) -> Any:
-            func_name = fn.__qualname__
-            start_time = time.perf_counter()
-            
-            try:
-                result = await fn(*args, **kwargs)
-                return _process_result(result, func_name, start_time)
-            except Exception:
-                # Still log timing even on error
-                elapsed_ms = (time.perf_counter() - start_time) * 1000
-                _log_timing(func_name, elapsed_ms)
-                raise
+        func_name = fn.__qualname__
+        speed_head = f"[SPEED] {func_name}"
+        # Unset thresholds become infinity so the per-call check is one comparison
+        error_limit_ms = math.inf if error_threshold_ms is None else error_threshold_ms
+        warn_limit_ms = math.inf if warn_threshold_ms is None else warn_threshold_ms
         
-        @functools.wraps(fn)
-        def sync_wrapper(*args, **kwargs) -> Any:
-            func_name = fn.__qualname__
-            start_time = time.perf_counter()
+        if is_async(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                start_time = time.perf_counter()
+                
+                try:
+                    result = await fn(*args, **kwargs)
+                    return _process_result(result, start_time)
+                except Exception:
+                    # Still log timing even on error
+                    elapsed_ms = (time.perf_counter() - start_time) * 1000
+                    _log_timing(elapsed_ms)
+                    raise
             
-            try:
-                result = fn(*args, **kwargs)
-                return _process_result(result, func_name, start_time)
-            except Exception:
-                elapsed_ms = (time.perf_counter() - start_time) * 1000
-                _log_timing(func_name, elapsed_ms)
-                raise
-        
-        def _process_result(result: Any, func_name: str, start_time: float) -> Any:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            _log_timing(func_name, elapsed_ms)
+            wrapper = async_wrapper
+        else:
+            @functools.wraps(fn)
+            def sync_wrapper(*args, **kwargs) -> Any:
+                start_time = time.perf_counter()
+                
+                try:
+                    result = fn(*args, **kwargs)
+                    return _process_result(result, start_time)
+                except Exception:
+                    elapsed_ms = (time.perf_counter() - start_time) * 1000
+                    _log_timing(elapsed_ms)
+                    raise
             
-            # Add header to response if requested
-            if include_in_response:
-                # Check if result is a Response object with headers
+            wrapper = sync_wrapper
+        
+        # Pick the result handler once instead of re-checking include_in_response
+        if include_in_response:
+            def _process_result(result: Any, start_time: float) -> Any:
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                _log_timing(elapsed_ms)
+                
+                # Add header if the result is a Response object with headers
                 if hasattr(result, 'headers'):
                     result.headers["X-Response-Time"] = f"{elapsed_ms:.2f}ms"
-            
-            return result
+                
+                return result
+        else:
+            def _process_result(result: Any, start_time: float) -> Any:
+                _log_timing((time.perf_counter() - start_time) * 1000)
+                return result
         
-        def _log_timing(func_name: str, elapsed_ms: float):
+        def _log_timing(elapsed_ms: float):
             # Determine log level based on thresholds
-            if error_threshold_ms is not None and elapsed_ms > error_threshold_ms:
-                logger.error(f"[SPEED] {func_name} | {elapsed_ms:.2f}ms (EXCEEDED ERROR THRESHOLD: {error_threshold_ms}ms)")
-            elif warn_threshold_ms is not None and elapsed_ms > warn_threshold_ms:
-                logger.warning(f"[SPEED] {func_name} | {elapsed_ms:.2f}ms (EXCEEDED WARN THRESHOLD: {warn_threshold_ms}ms)")
+            if elapsed_ms > error_limit_ms:
+                logger.error("%s | %.2fms (EXCEEDED ERROR THRESHOLD: %sms)", speed_head, elapsed_ms, error_threshold_ms)
+            elif elapsed_ms > warn_limit_ms:
+                logger.warning("%s | %.2fms (EXCEEDED WARN THRESHOLD: %sms)", speed_head, elapsed_ms, warn_threshold_ms)
             else:
-                logger.info(f"[SPEED] {func_name} | {elapsed_ms:.2f}ms")
+                logger.info("%s | %.2fms", speed_head, elapsed_ms)
             
             store = get_dev_store()
             if store:
                 store.add_speed(func_name, elapsed_ms)
         
-        if is_async(fn):
-            return async_wrapper
-        return sync_wrapper
+        return wrapper
     
     # Handle both @speed and @speed(...) syntax
     if func is not None:
@@ -9,6 +9,10 @@ from .utils import get_dev_store, is_async
 
 logger = logging.getLogger("jec_api")
 
+# asyncio.timeout() (3.11+) runs the coroutine on the current task instead of
+# wrapping it in a new one like asyncio.wait_for() does.
+_has_asyncio_timeout = hasattr(asyncio, "timeout")
+
 
 def timeout(
     func: Callable = None,
@@ -48,39 +52,44 @@ def timeout(
     """
     
     def decorator(fn: Callable) -> Callable:
+        func_name = fn.__qualname__
+        
         error_message = message or f"Request timed out after {seconds} seconds"
         
-        @functools.wraps(fn)
-        async def async_wrapper(*args, **kwargs) -> Any:
-            func_name = fn.__qualname__
+        if is_async(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                try:
+                    if _has_asyncio_timeout:
+                        async with asyncio.timeout(seconds):
+                            return await fn(*args, **kwargs)
+                    result = await asyncio.wait_for(
+                        fn(*args, **kwargs),
+                        timeout=seconds
+                    )
+                    return result
+                except asyncio.TimeoutError:
+                    logger.error("[TIMEOUT] %s | exceeded %ss", func_name, seconds)
+                    
+                    store = get_dev_store()
+                    if store:
+                        store.add_log("error", func_name, f"TIMEOUT: exceeded {seconds}s")
+                    
+                    raise HTTPException(
+                        status_code=504,
+                        detail=error_message
+                    )
             
-            try:
-                result = await asyncio.wait_for(
-                    fn(*args, **kwargs),
-                    timeout=seconds
-                )
-                return result
-            except asyncio.TimeoutError:
-                logger.error(f"[TIMEOUT] {func_name} | exceeded {seconds}s")
-                
-                store = get_dev_store()
-                if store:
-                    store.add_log("error", func_name, f"TIMEOUT: exceeded {seconds}s")
-                
-                raise HTTPException(
-                    status_code=504,
-                    detail=error_message
-                )
-        
-        @functools.wraps(fn)
-        def sync_wrapper(*args, **kwargs) -> Any:
-            # For sync functions, we can't easily timeout without threads
-            # We'll just execute normally and log a warning
-            func_name = fn.__qualname__
-            logger.warning(f"[TIMEOUT] {func_name} | @timeout on sync functions is not fully supported")
-            return fn(*args, **kwargs)
-        
-        wrapper = async_wrapper if is_async(fn) else sync_wrapper
+            wrapper = async_wrapper
+        else:
+            @functools.wraps(fn)
+            def sync_wrapper(*args, **kwargs) -> Any:
+                # For sync functions, we can't easily timeout without threads
+                # We'll just execute normally and log a warning
+                logger.warning("[TIMEOUT] %s | @timeout on sync functions is not fully supported", func_name)
+                return fn(*args, **kwargs)
+            
+            wrapper = sync_wrapper
         
         # Store timeout metadata for introspection
         wrapper._timeout = True
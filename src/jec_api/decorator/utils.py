@@ -1,21 +1,43 @@
 import re
+import inspect
 import logging
 import asyncio
-from typing import Any, Optional, Tuple
-from fastapi import Request
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from fastapi import Request
 
 # Set up a default logger for JEC-API
 logger = logging.getLogger("jec_api")
 
+# Resolved once by get_dev_store() so wrappers skip the import machinery per call
+_store_getter: Any = None
+
+# Set when a dev console is mounted; until then decorators skip store bookkeeping
+_dev_store_enabled = False
+
+def _no_store() -> None:
+    return None
+
+def enable_dev_store() -> None:
+    """Start recording decorator events in the DevConsoleStore."""
+    global _dev_store_enabled
+    _dev_store_enabled = True
+
 def get_dev_store() -> Any:
     """Get the DevConsoleStore if dev mode is active."""
-    try:
-        from ..dev.dev_console import get_store
-        return get_store()
-    except ImportError:
+    global _store_getter
+    if not _dev_store_enabled:
         return None
+    if _store_getter is None:
+        try:
+            from ..dev.dev_console import get_store
+            _store_getter = get_store
+        except ImportError:
+            _store_getter = _no_store
+    return _store_getter()
 
-def find_request(args: tuple, kwargs: dict) -> Optional[Request]:
+def find_request(args: tuple, kwargs: dict) -> Optional["Request"]:
     """Find a FastAPI Request object in args or kwargs."""
     # Check kwargs first
     if 'request' in kwargs:
@@ -27,11 +49,43 @@ def find_request(args: tuple, kwargs: dict) -> Optional[Request]:
     
     # Check args (skip first arg which is usually 'self')
     for arg in args:
-        if isinstance(arg, Request) or (hasattr(arg, "app") and hasattr(arg, "headers")):
+        if hasattr(arg, "app") and hasattr(arg, "headers"):
             return arg
     
     return None
 
+def request_finder(fn: Callable) -> Callable[[tuple, dict], Optional["Request"]]:
+    """
+    Build a find_request() specialized to fn's signature.
+    
+    The request parameter is located once, so each call is a direct kwargs/args
+    lookup; the generic scan only runs if that lookup does not yield a request.
+    """
+    try:
+        params = list(inspect.signature(fn).parameters.values())
+    except (TypeError, ValueError):
+        return find_request
+    
+    for index, param in enumerate(params):
+        annotation = param.annotation
+        if param.name == "request" or getattr(annotation, "__name__", annotation) == "Request":
+            break
+    else:
+        return find_request
+    
+    name = param.name
+    positional = param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+    
+    def _find_request(args: tuple, kwargs: dict) -> Optional["Request"]:
+        req = kwargs.get(name)
+        if req is None and positional and len(args) > index:
+            req = args[index]
+        if hasattr(req, "app") and hasattr(req, "headers"):
+            return req
+        return find_request(args, kwargs)
+    
+    return _find_request
+
 def parse_version(version_str: str) -> Tuple[int, ...]:
     """Parse a version string into a tuple of integers for comparison."""
     # Remove any leading 'v' or 'V'
@@ -1,17 +1,51 @@
 import functools
-import re
 import logging
 import inspect
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Optional, Tuple
 from inspect import Parameter
 
 from fastapi import Request
 from fastapi.responses import JSONResponse
 
-from .utils import get_dev_store, find_request, check_version, is_async
+from .utils import get_dev_store, find_request, request_finder, check_version, is_async
 
 logger = logging.getLogger("jec_api")
 
+_MISSING_VERSION_PAYLOAD = {
+    "error": "API version required",
+    "detail": "This API requires strict versioning. Please provide the X-API-Version header.",
+    "required": "true"
+}
+
+_TWO_CHAR_OPERATORS = frozenset((">=", "<=", "==", "!="))
+
+# Per-endpoint cap on memoized X-API-Version results; clients send few distinct values
+_VERSION_CACHE_SIZE = 1024
+
+# Parameters are immutable, so every endpoint that needs an injected request shares one
+_REQUEST_PARAM = Parameter("request", kind=Parameter.KEYWORD_ONLY, annotation=Request, default=None)
+
+
+def _parse_constraint(constraint: str) -> Tuple[str, str]:
+    """Split a constraint like ">=1.0.0" into its operator and version."""
+    text = constraint.strip()
+    if text[:2] in _TWO_CHAR_OPERATORS:
+        operator, rest = text[:2], text[2:]
+    elif text[:1] in ("<", ">"):
+        operator, rest = text[:1], text[1:]
+    else:
+        operator, rest = "==", text
+    
+    if not rest:
+        raise ValueError(f"Invalid version constraint: {constraint}")
+    
+    # Validate version format (basic semver): must start with a digit
+    required_version = rest.strip()
+    if not "0" <= required_version[:1] <= "9":
+        raise ValueError(f"Invalid version format: {required_version}")
+    
+    return operator, required_version
+
 
 def version(
     constraint: str,
@@ -48,174 +82,147 @@ def version(
             async def post(self, data: CreateUserRequest):
                 return {"created": True}
     """
-    # Parse the constraint
-    match = re.match(r'^(>=|<=|>|<|==|!=)?(.+)$', constraint.strip())
-    if not match:
-        raise ValueError(f"Invalid version constraint: {constraint}")
-    
-    operator = match.group(1) or "=="
-    required_version = match.group(2).strip()
-    
-    # Validate version format (basic semver)
-    if not re.match(r'^\d+(\.\d+)*', required_version):
-        raise ValueError(f"Invalid version format: {required_version}")
+    operator, required_version = _parse_constraint(constraint)
     
     def decorator(func: Callable) -> Callable:
-        # Inspect the original function signature
-        sig = inspect.signature(func)
-        params = list(sig.parameters.values())
-        
-        # Check if 'request' is already in parameters
+        # Check if 'request' is already in parameters. Plain functions are read
+        # straight off their code object; inspect.signature() is only needed for
+        # wrapped callables or when a request parameter has to be added.
         request_param_present = False
-        for param in params:
-            if param.name == "request" or param.annotation == Request:
-                request_param_present = True
-                break
+        code = getattr(func, "__code__", None)
+        if code is not None and not hasattr(func, "__wrapped__") and not hasattr(func, "__signature__"):
+            arg_names = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+            annotations = getattr(func, "__annotations__", {})
+            request_param_present = "request" in arg_names or any(
+                annotations.get(name) is Request for name in arg_names
+            )
         
-        def _add_deprecation_headers(response: Any, request: Optional[Request] = None):
-            """Add deprecation headers if endpoint is deprecated."""
-            if not deprecated:
-                return
-            
-            # For JSONResponse or Response objects, add headers
-            if hasattr(response, 'headers'):
-                response.headers["Deprecation"] = "true"
-                if sunset:
-                    response.headers["Sunset"] = sunset
-                if message:
-                    response.headers["X-Deprecation-Message"] = message
-            
-            # Log deprecation warning
-            deprecation_msg = message or f"Endpoint {func.__qualname__} is deprecated"
+        if not request_param_present:
+            sig = inspect.signature(func)
+            params = tuple(sig.parameters.values())
+            for param in params:
+                if param.name == "request" or param.annotation == Request:
+                    request_param_present = True
+                    break
+        
+        # An injected request always arrives as kwargs["request"], which the
+        # generic finder checks first; otherwise locate the declared parameter.
+        find = request_finder(func) if request_param_present else find_request
+        func_name = func.__qualname__
+        error_detail = message or f"This endpoint requires API version {constraint}"
+        passed_cache: dict = {}
+        
+        if deprecated:
+            # Deprecation headers and log line only depend on decorator arguments
+            deprecation_headers = [("Deprecation", "true")]
+            if sunset:
+                deprecation_headers.append(("Sunset", sunset))
+            if message:
+                deprecation_headers.append(("X-Deprecation-Message", message))
+            deprecation_msg = message or f"Endpoint {func_name} is deprecated"
             if sunset:
                 deprecation_msg += f" (sunset: {sunset})"
-            logger.warning(f"[DEPRECATED] {deprecation_msg}")
-        
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs) -> Any:
-            # Try to find Request in kwargs or args
-            request = find_request(args, kwargs)
             
-            if request:
-                client_version = request.headers.get("X-API-Version")
-                
-                # Check for strict versioning
-                strict_versioning = getattr(request.app, "strict_versioning", False)
+            def _add_deprecation_headers(response: Any, request: Optional[Request] = None):
+                """Add deprecation headers to the response and log the deprecated call."""
+                # For JSONResponse or Response objects, add headers
+                if hasattr(response, 'headers'):
+                    headers = response.headers
+                    for name, value in deprecation_headers:
+                        headers[name] = value
                 
-                if not client_version and strict_versioning:
+                # Log deprecation warning
+                logger.warning("[DEPRECATED] %s", deprecation_msg)
+        else:
+            def _add_deprecation_headers(response: Any, request: Optional[Request] = None):
+                """Endpoint is not deprecated; nothing to add."""
+        
+        def _enforce(request: Request) -> Optional[JSONResponse]:
+            """Check the request's X-API-Version; return an error response if it fails."""
+            client_version = request.headers.get("X-API-Version")
+            
+            if not client_version:
+                # Strict versioning only matters when the header is missing, so
+                # the app flag is read here rather than on every request. It is
+                # not cached: it can be changed through tinker() at any time.
+                if getattr(request.app, "strict_versioning", False):
                     # Log failure to dev console
                     store = get_dev_store()
                     if store:
-                        store.add_version_check(func.__qualname__, constraint, "MISSING", False)
+                        store.add_version_check(func_name, constraint, "MISSING", False)
                         
-                    return JSONResponse(
-                        status_code=400,
-                        content={
-                            "error": "API version required",
-                            "detail": "This API requires strict versioning. Please provide the X-API-Version header.",
-                            "required": "true"
-                        }
-                    )
-
-                if client_version:
+                    return JSONResponse(status_code=400, content=_MISSING_VERSION_PAYLOAD)
+            else:
+                passed = passed_cache.get(client_version)
+                if passed is None:
                     passed = check_version(client_version, operator, required_version)
-                    
-                    # Log to dev console
-                    store = get_dev_store()
-                    if store:
-                        store.add_version_check(func.__qualname__, constraint, client_version, passed)
-                    
-                    if not passed:
-                        error_detail = message or f"This endpoint requires API version {constraint}"
-                        return JSONResponse(
-                            status_code=400,
-                            content={
-                                "error": "API version incompatible",
-                                "detail": error_detail,
-                                "your_version": client_version,
-                                "required": constraint
-                            }
-                        )
-            
-            # If we injected request but the original function doesn't want it, remove it
-            if not request_param_present and 'request' in kwargs:
-                kwargs.pop('request')
+                    if len(passed_cache) < _VERSION_CACHE_SIZE:
+                        passed_cache[client_version] = passed
                 
-            result = await func(*args, **kwargs)
-            _add_deprecation_headers(result, request)
-            return result
-        
-        @functools.wraps(func)
-        def sync_wrapper(*args, **kwargs) -> Any:
-            request = find_request(args, kwargs)
-            
-            if request:
-                client_version = request.headers.get("X-API-Version")
-                
-                # Check for strict versioning
-                strict_versioning = getattr(request.app, "strict_versioning", False)
+                # Log to dev console
+                store = get_dev_store()
+                if store:
+                    store.add_version_check(func_name, constraint, client_version, passed)
                 
-                if not client_version and strict_versioning:
-                    # Log failure to dev console
-                    store = get_dev_store()
-                    if store:
-                        store.add_version_check(func.__qualname__, constraint, "MISSING", False)
-                        
+                if not passed:
                     return JSONResponse(
                         status_code=400,
                         content={
-                            "error": "API version required",
-                            "detail": "This API requires strict versioning. Please provide the X-API-Version header.",
-                            "required": "true"
+                            "error": "API version incompatible",
+                            "detail": error_detail,
+                            "your_version": client_version,
+                            "required": constraint
                         }
                     )
-
-                if client_version:
-                    passed = check_version(client_version, operator, required_version)
-                    
-                    # Log to dev console
-                    store = get_dev_store()
-                    if store:
-                        store.add_version_check(func.__qualname__, constraint, client_version, passed)
+            
+            return None
+        
+        if is_async(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                # Try to find Request in kwargs or args
+                request = find(args, kwargs)
+                if request:
+                    error_response = _enforce(request)
+                    if error_response is not None:
+                        return error_response
+                
+                # If we injected request but the original function doesn't want it, remove it
+                if not request_param_present and 'request' in kwargs:
+                    kwargs.pop('request')
                     
-                    if not passed:
-                        error_detail = message or f"This endpoint requires API version {constraint}"
-                        return JSONResponse(
-                            status_code=400,
-                            content={
-                                "error": "API version incompatible",
-                                "detail": error_detail,
-                                "your_version": client_version,
-                                "required": constraint
-                            }
-                        )
+                result = await func(*args, **kwargs)
+                _add_deprecation_headers(result, request)
+                return result
             
-            # If we injected request but the original function doesn't want it, remove it
-            if not request_param_present and 'request' in kwargs:
-                kwargs.pop('request')
+            wrapper = async_wrapper
+        else:
+            @functools.wraps(func)
+            def sync_wrapper(*args, **kwargs) -> Any:
+                request = find(args, kwargs)
+                if request:
+                    error_response = _enforce(request)
+                    if error_response is not None:
+                        return error_response
+                
+                # If we injected request but the original function doesn't want it, remove it
+                if not request_param_present and 'request' in kwargs:
+                    kwargs.pop('request')
 
-            result = func(*args, **kwargs)
-            _add_deprecation_headers(result, request)
-            return result
+                result = func(*args, **kwargs)
+                _add_deprecation_headers(result, request)
+                return result
+            
+            wrapper = sync_wrapper
         
         # Store version info on the function for introspection
-        wrapper = async_wrapper if is_async(func) else sync_wrapper
         wrapper._version_constraint = constraint
         wrapper._deprecated = deprecated
         wrapper._sunset = sunset
         
         # Modify signature if request param is missing
         if not request_param_present:
-            new_params = params.copy()
-            new_params.append(
-                Parameter(
-                    "request",
-                    kind=Parameter.KEYWORD_ONLY,
-                    annotation=Request,
-                    default=None
-                )
-            )
-            wrapper.__signature__ = sig.replace(parameters=new_params)
+            wrapper.__signature__ = sig.replace(parameters=[*params, _REQUEST_PARAM])
             
         return wrapper
     
@@ -1,27 +1,109 @@
 """Dev Console - Real-time debugging console for JEC API."""
 
+import gzip
+import sys
 import time
 import json
 import asyncio
 import inspect
+import itertools
+import math
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 from collections import deque
-from threading import Lock
+from threading import Lock, get_ident
 
 from fastapi import APIRouter, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import HTMLResponse, StreamingResponse
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Preferred Content-Encodings for the console page, best first
+_PAGE_ENCODINGS = ("br", "gzip")
+
+# Tester stylesheet/script served beside the page: name -> (index into the tester asset tuple, media type)
+_TESTER_ASSET_FILES = {
+    "tester.css": (1, "text/css"),
+    "tester.js": (2, "application/javascript"),
+}
+
+
+def _accepted_encodings(header: str) -> set:
+    """Content-codings the client accepts, leaving out any refused with ``q=0``."""
+    accepted = set()
+    for part in header.split(","):
+        coding, *params = part.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        refused = False
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    refused = float(value) <= 0
+                except ValueError:
+                    pass
+        if not refused:
+            accepted.add(coding)
+    return accepted
+
+
 # Lazy import to avoid circular dependency
 # from .dev_endpoint_tester import get_tester_html, extract_endpoint_schema
 
+def _json_bytes(data: Any) -> bytes:
+    """Encode JSON-safe data to UTF-8 bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+# (whole second, its local ISO prefix); swapped as one tuple so threads never see a mix
+_timestamp_second: Tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(ts: float) -> str:
+    """Format a time.time() value like datetime.isoformat(), reusing the per-second prefix."""
+    global _timestamp_second
+    # Split and round the same way datetime.fromtimestamp() does
+    frac, whole = math.modf(ts)
+    micros = round(frac * 1_000_000)
+    if micros >= 1_000_000:
+        whole += 1
+        micros -= 1_000_000
+    elif micros < 0:
+        whole -= 1
+        micros += 1_000_000
+    second = int(whole)
+    cached_second, prefix = _timestamp_second
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second).isoformat()
+        _timestamp_second = (second, prefix)
+    # isoformat() omits the fraction entirely on a whole second
+    return f"{prefix}.{micros:06d}" if micros else prefix
+
+
+# Entries are created for every request/log/timing event; drop their
+# per-instance __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class RequestLog:
     """HTTP request log entry."""
-    id: str
-    timestamp: str
+    id: int  # formatted as a zero-padded string by to_dict()
+    timestamp: float  # time.time(); formatted by to_dict()
     method: str
     path: str
     status_code: int
@@ -29,39 +111,125 @@ class RequestLog:
     client_ip: str
     headers: Dict[str, str] = field(default_factory=dict)
     query_params: Dict[str, str] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": f"{self.id:08d}",
+            "timestamp": _format_timestamp(self.timestamp),
+            "method": self.method,
+            "path": self.path,
+            "status_code": self.status_code,
+            "duration_ms": self.duration_ms,
+            "client_ip": self.client_ip,
+            "headers": self.headers,
+            "query_params": self.query_params,
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LogEntry:
     """@log decorator entry."""
-    id: str
-    timestamp: str
+    id: int
+    timestamp: float  # time.time(); formatted by to_dict()
     level: str  # info, warning, error
     function: str
     message: str
     args: str = ""
     result: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": f"{self.id:08d}",
+            "timestamp": _format_timestamp(self.timestamp),
+            "level": self.level,
+            "function": self.function,
+            "message": self.message,
+            "args": self.args,
+            "result": self.result,
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SpeedMetric:
     """@speed decorator timing entry."""
-    id: str
-    timestamp: str
+    id: int
+    timestamp: float  # time.time(); formatted by to_dict()
     function: str
     duration_ms: float
     path: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": f"{self.id:08d}",
+            "timestamp": _format_timestamp(self.timestamp),
+            "function": self.function,
+            "duration_ms": self.duration_ms,
+            "path": self.path,
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class VersionCheck:
     """@version decorator check entry."""
-    id: str
-    timestamp: str
+    id: int
+    timestamp: float  # time.time(); formatted by to_dict()
     function: str
     constraint: str
     client_version: str
     passed: bool
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": f"{self.id:08d}",
+            "timestamp": _format_timestamp(self.timestamp),
+            "function": self.function,
+            "constraint": self.constraint,
+            "client_version": self.client_version,
+            "passed": self.passed,
+        }
+
+
+class _Subscriber:
+    """Per-connection SSE buffer: a bounded deque of encoded events plus a wakeup event."""
+
+    __slots__ = ("events", "ready", "_loop", "_thread")
+
+    def __init__(self, maxlen: int = 100):
+        # deque(maxlen) drops the oldest event when a slow client falls behind
+        self.events: deque = deque(maxlen=maxlen)
+        self.ready = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._thread = get_ident()
+
+    def push(self, payload: bytes) -> bool:
+        """Buffer ``payload`` and wake the consumer; False if its loop has closed."""
+        self.events.append(payload)
+        if self.ready.is_set():
+            return True
+        # Entries are also recorded from sync endpoints running in the
+        # threadpool; asyncio.Event must only be touched from its own loop.
+        try:
+            if get_ident() == self._thread:
+                self.ready.set()
+            else:
+                self._loop.call_soon_threadsafe(self.ready.set)
+        except RuntimeError:  # loop closed before the stream's finally ran
+            return False
+        return True
+
+    def drain(self) -> bytes:
+        """Pop every buffered event and frame them as a single SSE record.
+
+        A burst of events is coalesced into one ``batch`` message so the
+        client parses and re-renders once rather than once per event.
+        """
+        events = self.events
+        payloads = []
+        while events:
+            payloads.append(events.popleft())
+        if len(payloads) == 1:
+            return b"data: " + payloads[0] + b"\n\n"
+        return b'data: {"type":"batch","data":[' + b",".join(payloads) + b"]}\n\n"
 
 
 class DevConsoleStore:
@@ -84,7 +252,11 @@ class DevConsoleStore:
             return
         self._initialized = True
         self._max_entries = max_entries
-        self._counter = 0
+        # next() on itertools.count is atomic under the GIL, unlike += on an int
+        self._ids = itertools.count(1)
+        # get_all() result, valid while _generation still equals the first item
+        self._generation = 0
+        self._snapshot: Optional[Tuple[int, Dict[str, List[Dict]]]] = None
         
         self.requests: deque = deque(maxlen=max_entries)
         self.logs: deque = deque(maxlen=max_entries)
@@ -92,24 +264,47 @@ class DevConsoleStore:
         self.version_checks: deque = deque(maxlen=max_entries)
         
         # SSE subscribers
-        self._subscribers: List[asyncio.Queue] = []
+        # Replaced wholesale (copy-on-write) under _sub_lock, so _notify can
+        # iterate the current tuple without taking the lock.
+        self._subscribers: Tuple[_Subscriber, ...] = ()
         self._sub_lock = Lock()
     
-    def _next_id(self) -> str:
-        self._counter += 1
-        return f"{self._counter:08d}"
+    def _next_id(self) -> int:
+        return next(self._ids)
     
-    def _now(self) -> str:
-        return datetime.now().isoformat()
+    def _now(self) -> float:
+        # Entries keep the raw clock value; ISO formatting is deferred to to_dict()
+        return time.time()
+    
+    def _record(self, buffer: deque, cls: type, **fields) -> Any:
+        """Append a new entry to ``buffer``, recycling the one it would evict.
+
+        Once a buffer is full every append drops its oldest entry, so that
+        instance is re-initialised in place instead of allocating a new one.
+        Entries returned by the ``add_*`` methods are therefore only valid
+        until the buffer wraps around.
+        """
+        if len(buffer) == buffer.maxlen:
+            try:
+                entry = buffer.popleft()
+            except IndexError:  # cleared concurrently
+                entry = cls(**fields)
+            else:
+                entry.__init__(**fields)
+        else:
+            entry = cls(**fields)
+        buffer.append(entry)
+        self._generation = entry.id
+        return entry
     
     def add_request(self, **kwargs) -> RequestLog:
-        entry = RequestLog(id=self._next_id(), timestamp=self._now(), **kwargs)
-        self.requests.append(entry)
+        entry = self._record(self.requests, RequestLog, id=self._next_id(), timestamp=self._now(), **kwargs)
         self._notify("request", entry)
         return entry
     
     def add_log(self, level: str, function: str, message: str, **kwargs) -> LogEntry:
-        entry = LogEntry(
+        entry = self._record(
+            self.logs, LogEntry,
             id=self._next_id(), 
             timestamp=self._now(),
             level=level,
@@ -117,25 +312,25 @@ class DevConsoleStore:
             message=message,
             **kwargs
         )
-        self.logs.append(entry)
         self._notify("log", entry)
         return entry
     
     def add_speed(self, function: str, duration_ms: float, path: str = "") -> SpeedMetric:
-        entry = SpeedMetric(
+        entry = self._record(
+            self.speed_metrics, SpeedMetric,
             id=self._next_id(),
             timestamp=self._now(),
             function=function,
             duration_ms=duration_ms,
             path=path
         )
-        self.speed_metrics.append(entry)
         self._notify("speed", entry)
         return entry
     
     def add_version_check(self, function: str, constraint: str, 
                           client_version: str, passed: bool) -> VersionCheck:
-        entry = VersionCheck(
+        entry = self._record(
+            self.version_checks, VersionCheck,
             id=self._next_id(),
             timestamp=self._now(),
             function=function,
@@ -143,41 +338,55 @@ class DevConsoleStore:
             client_version=client_version,
             passed=passed
         )
-        self.version_checks.append(entry)
         self._notify("version", entry)
         return entry
     
     def _notify(self, event_type: str, entry: Any):
         """Notify all SSE subscribers of new data."""
-        data = {"type": event_type, "data": asdict(entry)}
-        with self._sub_lock:
-            for queue in self._subscribers:
-                try:
-                    queue.put_nowait(data)
-                except asyncio.QueueFull:
-                    pass  # Drop if queue is full
+        # Nobody is watching the console most of the time; skip the
+        # serialization entirely in that case.
+        subscribers = self._subscribers
+        if not subscribers:
+            return
+        # Encode the event once and hand the same bytes to every subscriber
+        payload = _json_bytes({"type": event_type, "data": entry.to_dict()})
+        for subscriber in subscribers:
+            if not subscriber.push(payload):
+                self.unsubscribe(subscriber)
     
-    def subscribe(self) -> asyncio.Queue:
-        """Subscribe to real-time updates."""
-        queue = asyncio.Queue(maxsize=100)
+    def subscribe(self) -> _Subscriber:
+        """Subscribe to real-time updates, buffered as JSON-encoded events (bytes).
+
+        Must be called from within the event loop that will consume the events.
+        """
+        subscriber = _Subscriber()
         with self._sub_lock:
-            self._subscribers.append(queue)
-        return queue
+            self._subscribers = (*self._subscribers, subscriber)
+        return subscriber
     
-    def unsubscribe(self, queue: asyncio.Queue):
+    def unsubscribe(self, subscriber: _Subscriber):
         """Unsubscribe from updates."""
         with self._sub_lock:
-            if queue in self._subscribers:
-                self._subscribers.remove(queue)
+            self._subscribers = tuple(s for s in self._subscribers if s is not subscriber)
     
     def get_all(self) -> Dict[str, List[Dict]]:
-        """Get all stored data."""
-        return {
-            "requests": [asdict(r) for r in self.requests],
-            "logs": [asdict(l) for l in self.logs],
-            "speed_metrics": [asdict(s) for s in self.speed_metrics],
-            "version_checks": [asdict(v) for v in self.version_checks],
+        """Get all stored data.
+
+        The result is cached until the next entry is recorded, so callers
+        must treat it as read-only.
+        """
+        generation = self._generation
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == generation:
+            return snapshot[1]
+        data = {
+            "requests": [r.to_dict() for r in self.requests],
+            "logs": [l.to_dict() for l in self.logs],
+            "speed_metrics": [s.to_dict() for s in self.speed_metrics],
+            "version_checks": [v.to_dict() for v in self.version_checks],
         }
+        self._snapshot = (generation, data)
+        return data
     
     def clear(self):
         """Clear all stored data."""
@@ -185,6 +394,7 @@ class DevConsoleStore:
         self.logs.clear()
         self.speed_metrics.clear()
         self.version_checks.clear()
+        self._generation = next(self._ids)
 
 
 # Global store instance
@@ -199,63 +409,117 @@ def get_store() -> DevConsoleStore:
 def create_dev_router(base_path: str = "/__dev__", app_instance: Any = None) -> APIRouter:
     """Create the dev console API router."""
     router = APIRouter(prefix=base_path, tags=["Dev Console"])
+    console_pages: Dict[str, bytes] = {}
     
     @router.get("/", response_class=HTMLResponse)
-    async def dev_console_ui():
+    async def dev_console_ui(request: Request):
         """Serve the dev console HTML UI."""
-        from .dev_endpoint_tester import get_tester_html
-        
-        # Get tester HTML components
-        tester_html, tester_css, tester_js = get_tester_html()
-        
-        return _get_console_html(base_path, tester_html, tester_css, tester_js)
+        if not console_pages:
+            from .dev_endpoint_tester import get_tester_html, get_tester_html_bytes
+            from ..decorator.cache import _compute_etag
+            
+            # The page is static for this router, so render, encode and compress it once.
+            # The tester CSS/JS are linked with a content hash so browsers cache them
+            # across console loads instead of receiving them inline every time.
+            tester_html = get_tester_html()[0]
+            tester_version = _compute_etag(b"".join(get_tester_html_bytes()[1:]))
+            page = _get_console_html(base_path, tester_html, tester_version).encode("utf-8")
+            console_pages["gzip"] = gzip.compress(page, 9)
+            if brotli is not None:
+                console_pages["br"] = brotli.compress(page, quality=11)
+            console_pages["identity"] = page
+        
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        for encoding in _PAGE_ENCODINGS:
+            if encoding in accepted and encoding in console_pages:
+                return HTMLResponse(
+                    content=console_pages[encoding],
+                    headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+                )
+        return HTMLResponse(content=console_pages["identity"], headers={"Vary": "Accept-Encoding"})
+    
+    @router.get("/assets/{name}")
+    async def tester_asset(name: str, request: Request):
+        """Serve the endpoint tester stylesheet or script, pre-gzipped when accepted."""
+        asset = _TESTER_ASSET_FILES.get(name)
+        if asset is None:
+            return Response(status_code=404)
+        
+        from .dev_endpoint_tester import get_tester_assets_gz, get_tester_html_bytes
+        
+        index, media_type = asset
+        # URLs carry a content hash (?v=), so a fetched copy never goes stale
+        headers = {"Cache-Control": "public, max-age=31536000, immutable", "Vary": "Accept-Encoding"}
+        if "gzip" in _accepted_encodings(request.headers.get("accept-encoding", "")):
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=get_tester_assets_gz()[index][0], media_type=media_type, headers=headers)
+        return Response(content=get_tester_html_bytes()[index], media_type=media_type, headers=headers)
+    
+    endpoints_payload: Dict[str, Any] = {}
     
     @router.get("/api/endpoints")
-    async def get_endpoints():
+    async def get_endpoints(request: Request):
         """Get list of available endpoints with schema information."""
         if not app_instance:
             return []
             
         from .dev_endpoint_tester import extract_endpoint_schema
+        from ..decorator.cache import _compute_etag, _etag_matches
         
-        endpoints = []
-        registered_routes = app_instance.get_registered_routes()
-        
-        for route_class in registered_routes:
-            base_route_path = route_class.get_path()
-            for http_method, sub_path, method_func, req_type, resp_type in route_class.get_endpoints():
-                # Build proper full path
-                if sub_path == "/":
-                    full_path = base_route_path
-                else:
-                    full_path = base_route_path.rstrip("/") + sub_path
-                
-                # Extract schema info
-                input_schema = extract_endpoint_schema(req_type) if req_type else None
-                output_schema = extract_endpoint_schema(resp_type) if resp_type else None
-                
-                # Detect required headers from decorators
-                required_headers = []
-                
-                # Check for @version decorator
-                version_constraint = getattr(method_func, '_version_constraint', None)
-                if version_constraint:
-                    required_headers.append({
-                        'key': 'X-API-Version',
-                        'value': '1.0.0',
-                        'hint': f'Required: {version_constraint}'
+        # Descriptors, body and ETag only change when routes are registered
+        registered_routes = tuple(app_instance.get_registered_routes())
+        if endpoints_payload.get("routes") != registered_routes:
+            endpoints = []
+            
+            for route_class in registered_routes:
+                base_route_path = route_class.get_path()
+                for http_method, sub_path, method_func, req_type, resp_type in route_class.get_endpoints():
+                    # Build proper full path
+                    if sub_path == "/":
+                        full_path = base_route_path
+                    else:
+                        full_path = base_route_path.rstrip("/") + sub_path
+                    
+                    # Extract schema info
+                    input_schema = extract_endpoint_schema(req_type) if req_type else None
+                    output_schema = extract_endpoint_schema(resp_type) if resp_type else None
+                    
+                    # Detect required headers from decorators
+                    required_headers = []
+                    
+                    # Check for @version decorator
+                    version_constraint = getattr(method_func, '_version_constraint', None)
+                    if version_constraint:
+                        required_headers.append({
+                            'key': 'X-API-Version',
+                            'value': '1.0.0',
+                            'hint': f'Required: {version_constraint}'
+                        })
+                    
+                    endpoints.append({
+                        "method": http_method,
+                        "path": full_path,
+                        "function": method_func.__name__,
+                        "input_schema": input_schema,
+                        "output_schema": output_schema,
+                        "required_headers": required_headers
                     })
-                
-                endpoints.append({
-                    "method": http_method,
-                    "path": full_path,
-                    "function": method_func.__name__,
-                    "input_schema": input_schema,
-                    "output_schema": output_schema,
-                    "required_headers": required_headers
-                })
-        
-        return endpoints
+            
+            body = json.dumps(jsonable_encoder(endpoints)).encode("utf-8")
+            endpoints_payload.update(
+                routes=registered_routes,
+                body=body,
+                etag=f'"{_compute_etag(body)}"',
+            )
+        
+        # Let the tester revalidate its sessionStorage copy with If-None-Match
+        body = endpoints_payload["body"]
+        etag = endpoints_payload["etag"]
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
 
     @router.get("/api/all")
     async def get_all_data():
@@ -265,43 +529,48 @@ def create_dev_router(base_path: str = "/__dev__", app_instance: Any = None) ->
     @router.get("/api/requests")
     async def get_requests():
         """Get request log history."""
-        return [asdict(r) for r in _store.requests]
+        return [r.to_dict() for r in _store.requests]
     
     @router.get("/api/logs")
     async def get_logs():
         """Get decorator log entries."""
-        return [asdict(l) for l in _store.logs]
+        return [l.to_dict() for l in _store.logs]
     
     @router.get("/api/speed")
     async def get_speed_metrics():
         """Get speed timing metrics."""
-        return [asdict(s) for s in _store.speed_metrics]
+        return [s.to_dict() for s in _store.speed_metrics]
     
     @router.get("/api/versions")
     async def get_version_checks():
         """Get version check history."""
-        return [asdict(v) for v in _store.version_checks]
+        return [v.to_dict() for v in _store.version_checks]
     
     @router.get("/api/stream")
     async def sse_stream(request: Request):
         """Server-Sent Events stream for real-time updates."""
         async def event_generator():
-            queue = _store.subscribe()
+            subscriber = _store.subscribe()
             try:
                 # Send initial data
-                yield f"data: {json.dumps({'type': 'init', 'data': _store.get_all()})}\n\n"
+                yield b"data: " + _json_bytes({"type": "init", "data": _store.get_all()}) + b"\n\n"
                 
                 while True:
                     if await request.is_disconnected():
                         break
-                    try:
-                        data = await asyncio.wait_for(queue.get(), timeout=30.0)
-                        yield f"data: {json.dumps(data)}\n\n"
-                    except asyncio.TimeoutError:
-                        # Send heartbeat
-                        yield f": heartbeat\n\n"
+                    # Clear before checking so a push in between re-sets the event
+                    subscriber.ready.clear()
+                    if not subscriber.events:
+                        try:
+                            await asyncio.wait_for(subscriber.ready.wait(), timeout=30.0)
+                        except asyncio.TimeoutError:
+                            # Send heartbeat
+                            yield b": heartbeat\n\n"
+                            continue
+                    # Flush everything buffered since the last wakeup in one write
+                    yield subscriber.drain()
             finally:
-                _store.unsubscribe(queue)
+                _store.unsubscribe(subscriber)
         
         return StreamingResponse(
             event_generator(),
@@ -322,8 +591,8 @@ def create_dev_router(base_path: str = "/__dev__", app_instance: Any = None) ->
     return router
 
 
-def _get_console_html(base_path: str, tester_html: str = "", tester_css: str = "", tester_js: str = "") -> str:
-    """Generate the dev console HTML with embedded CSS/JS."""
+def _get_console_html(base_path: str, tester_html: str = "", tester_version: str = "") -> str:
+    """Generate the dev console HTML with embedded CSS/JS; the tester's CSS/JS are linked assets."""
     return f'''<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -842,8 +1111,8 @@ def _get_console_html(base_path: str, tester_html: str = "", tester_css: str = "
         ::-webkit-scrollbar-thumb:hover {{ background: var(--border-light); }}
         
         .icon {{ width: 14px; height: 14px; stroke: currentColor; stroke-width: 2; fill: none; }}
-        {tester_css}
     </style>
+    <link rel="stylesheet" href="{base_path}/assets/tester.css?v={tester_version}">
 </head>
 <body>
     <header class="header">
@@ -921,6 +1190,7 @@ def _get_console_html(base_path: str, tester_html: str = "", tester_css: str = "
         </div>
     </main>
     
+    <script src="{base_path}/assets/tester.js?v={tester_version}"></script>
     <script>
         const API_BASE = '{base_path}';
         
@@ -955,19 +1225,30 @@ def _get_console_html(base_path: str, tester_html: str = "", tester_css: str = "
                     speedMetrics = msg.data.speed_metrics || [];
                     versionChecks = msg.data.version_checks || [];
                     renderRequests();
-                }} else if (msg.type === 'request') {{
-                    requests.push(msg.data);
-                    renderRequests();
-                }} else if (msg.type === 'log') {{
-                    logs.push(msg.data);
-                    if (selectedRequestId) updateSidebar();
-                }} else if (msg.type === 'speed') {{
-                    speedMetrics.push(msg.data);
-                    if (selectedRequestId) updateSidebar();
-                }} else if (msg.type === 'version') {{
-                    versionChecks.push(msg.data);
-                    if (selectedRequestId) updateSidebar();
+                    return;
                 }}
+                
+                // Bursts arrive as one 'batch' message; apply them all, then render once
+                const events = msg.type === 'batch' ? msg.data : [msg];
+                let requestsChanged = false;
+                let detailsChanged = false;
+                for (const evt of events) {{
+                    if (evt.type === 'request') {{
+                        requests.push(evt.data);
+                        requestsChanged = true;
+                    }} else if (evt.type === 'log') {{
+                        logs.push(evt.data);
+                        detailsChanged = true;
+                    }} else if (evt.type === 'speed') {{
+                        speedMetrics.push(evt.data);
+                        detailsChanged = true;
+                    }} else if (evt.type === 'version') {{
+                        versionChecks.push(evt.data);
+                        detailsChanged = true;
+                    }}
+                }}
+                if (requestsChanged) renderRequests();
+                if (detailsChanged && selectedRequestId) updateSidebar();
             }};
             
             evtSource.onerror = () => {{
@@ -1116,13 +1397,12 @@ def _get_console_html(base_path: str, tester_html: str = "", tester_css: str = "
             }}).join('');
         }}
         
+        const HTML_ESCAPES = {{ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' }};
+        
         function escapeHtml(str) {{
             if (!str) return '';
-            return String(str)
-                .replace(/&/g, '&amp;')
-                .replace(/</g, '&lt;')
-                .replace(/>/g, '&gt;')
-                .replace(/"/g, '&quot;');
+            // One scan with a lookup instead of four chained replaces
+            return String(str).replace(/[&<>"]/g, ch => HTML_ESCAPES[ch]);
         }}
         
         async function clearData() {{
@@ -1138,8 +1418,6 @@ def _get_console_html(base_path: str, tester_html: str = "", tester_css: str = "
         
         connect();
         
-        {tester_js}
-        
         // Tester toggle logic
         const testerOverlay = document.getElementById('tester-overlay');
         const toggleTesterBtn = document.getElementById('toggle-tester');
@@ -3,52 +3,85 @@ Dev Endpoint Tester Component.
 Provides UI and logic for testing API endpoints directly from the dev console.
 """
 
-import json
-import inspect
-from typing import Any, Dict, List, Optional, Type, get_type_hints, Union
-from enum import Enum
+import gzip
+import types
+import functools
+from weakref import WeakKeyDictionary
+from typing import Any, Dict, List, Type, get_type_hints, Union, get_origin, get_args
 
 try:
     from pydantic import BaseModel
 except ImportError:
     BaseModel = None
 
+# Every model class is an instance of BaseModel's metaclass, so a single
+# isinstance() check stands in for isinstance(type) + issubclass(BaseModel).
+_ModelMetaclass = type(BaseModel) if BaseModel is not None else None
+
+
+# One shared schema object per primitive kind, so aliases (str / "str") map to
+# the same dict and consumers can compare by identity
+_NULL_SCHEMA = {"type": "null"}
+_STRING_SCHEMA = {"type": "string"}
+_INTEGER_SCHEMA = {"type": "integer"}
+_NUMBER_SCHEMA = {"type": "number"}
+_BOOLEAN_SCHEMA = {"type": "boolean"}
+_ARRAY_SCHEMA = {"type": "array"}
+_OBJECT_SCHEMA = {"type": "object"}
+
+_PRIMITIVE_SCHEMAS: Dict[Any, Dict[str, Any]] = {
+    None: _NULL_SCHEMA,
+    type(None): _NULL_SCHEMA,
+    str: _STRING_SCHEMA,
+    "str": _STRING_SCHEMA,
+    int: _INTEGER_SCHEMA,
+    "int": _INTEGER_SCHEMA,
+    float: _NUMBER_SCHEMA,
+    "float": _NUMBER_SCHEMA,
+    bool: _BOOLEAN_SCHEMA,
+    "bool": _BOOLEAN_SCHEMA,
+    list: _ARRAY_SCHEMA,
+    "list": _ARRAY_SCHEMA,
+    List: _ARRAY_SCHEMA,
+    dict: _OBJECT_SCHEMA,
+    "dict": _OBJECT_SCHEMA,
+    Dict: _OBJECT_SCHEMA,
+}
+
 
 def extract_endpoint_schema(type_hint: Type) -> Dict[str, Any]:
     """
     Extract a JSON-serializable schema from a Python type hint.
     Supports Pydantic models, dataclasses, and basic types.
+    
+    Results are cached per type and shared between callers; do not mutate them.
     """
-    if type_hint is None:
-        return {"type": "null"}
-        
+    # Handle None and primitive types
+    try:
+        schema = _PRIMITIVE_SCHEMAS.get(type_hint)
+    except TypeError:
+        # e.g. Annotated[...] with unhashable metadata; build it uncached
+        return _build_endpoint_schema(type_hint)
+    if schema is not None:
+        return schema
+    return _cached_endpoint_schema(type_hint)
+
+
+def _build_endpoint_schema(type_hint: Type) -> Dict[str, Any]:
+    """Build the schema for a non-primitive type hint; see extract_endpoint_schema()."""
     # Handle Pydantic models
-    if BaseModel and isinstance(type_hint, type) and issubclass(type_hint, BaseModel):
+    if _ModelMetaclass is not None and isinstance(type_hint, _ModelMetaclass):
         try:
             return type_hint.model_json_schema()
         except AttributeError:
             # Fallback for older Pydantic versions
             return type_hint.schema()
             
-    # Handle primitive types
-    if type_hint in (str, "str"):
-        return {"type": "string"}
-    if type_hint in (int, "int"):
-        return {"type": "integer"}
-    if type_hint in (float, "float"):
-        return {"type": "number"}
-    if type_hint in (bool, "bool"):
-        return {"type": "boolean"}
-    if type_hint in (list, "list", List):
-        return {"type": "array"}
-    if type_hint in (dict, "dict", Dict):
-        return {"type": "object"}
-        
     # Handle basic dataclasses or custom classes
     if hasattr(type_hint, "__annotations__"):
         properties = {}
         required = []
-        for name, field_type in type_hint.__annotations__.items():
+        for name, field_type in _field_hints(type_hint):
             properties[name] = extract_endpoint_schema(field_type)
             # Assume all fields are required for simplicity unless Optional
             if not _is_optional(field_type):
@@ -64,19 +97,41 @@ def extract_endpoint_schema(type_hint: Type) -> Dict[str, Any]:
     return {"type": "string", "description": str(type_hint)}
 
 
+_cached_endpoint_schema = functools.lru_cache(maxsize=512)(_build_endpoint_schema)
+
+# typing.Union plus PEP 604 `X | None` unions on Python 3.10+
+_UNION_ORIGINS = (Union, types.UnionType) if hasattr(types, "UnionType") else (Union,)
+
+# Resolved (name, type) pairs per class; weak keys so dynamic classes can be collected
+_FIELD_HINTS_CACHE: "WeakKeyDictionary[Any, tuple]" = WeakKeyDictionary()
+
+
+def _field_hints(cls: Any) -> tuple:
+    """Return cls's annotated fields with forward references resolved once."""
+    try:
+        return _FIELD_HINTS_CACHE[cls]
+    except (KeyError, TypeError):
+        pass
+    
+    try:
+        hints = tuple(get_type_hints(cls).items())
+    except Exception:
+        # Unresolvable forward references; fall back to the raw annotations
+        hints = tuple(cls.__annotations__.items())
+    
+    try:
+        _FIELD_HINTS_CACHE[cls] = hints
+    except TypeError:
+        pass  # not weak-referenceable
+    return hints
+
+
 def _is_optional(t: Type) -> bool:
-    """Check if a type is Optional[T]."""
-    if hasattr(t, "__origin__") and t.__origin__ is Union:
-        return type(None) in t.__args__
-    return False
+    """Check if a type is Optional[T] (or T | None)."""
+    return get_origin(t) in _UNION_ORIGINS and type(None) in get_args(t)
 
 
-def get_tester_html() -> tuple[str, str, str]:
-    """
-    Returns the HTML, CSS, and JS for the endpoint tester component.
-    """
-    
-    html = """
+_HTML = """
     <div class="tester-container">    
         <div class="tester-content">
             <div class="tester-sidebar">
@@ -143,9 +198,13 @@ def get_tester_html() -> tuple[str, str, str]:
             </div>
         </div>
     </div>
+    <template id="endpoint-item-tpl">
+        <div class="endpoint-item"><span class="method-badge"></span><span class="path"></span></div>
+    </template>
     """
-    
-    css = """
+
+
+_CSS = """
     .tester-overlay {
         position: fixed;
         top: 60px;
@@ -322,6 +381,9 @@ def get_tester_html() -> tuple[str, str, str]:
         gap: 10px;
         border-bottom: 1px solid var(--border);
         transition: all 0.1s ease;
+        /* Skip layout/paint for rows scrolled out of view */
+        content-visibility: auto;
+        contain-intrinsic-size: auto 40px;
     }
     
     .endpoint-item:last-child {
@@ -664,6 +726,7 @@ def get_tester_html() -> tuple[str, str, str]:
         color: var(--text-primary);
         white-space: pre-wrap;
         line-height: 1.6;
+        contain: content;
     }
     
     .code-viewer .key { color: #60a5fa; }
@@ -762,13 +825,26 @@ def get_tester_html() -> tuple[str, str, str]:
         to { transform: rotate(360deg); }
     }
     """
-    
-    js = r"""
+
+
+_JS = r"""
     let endpoints = [];
+    let endpointGroups = [];
     let selectedEndpoint = null;
     let expandedGroup = null;
     let headersExpanded = false;
     let requestHeaders = [];
+    let renderSeq = 0;
+    let downloadUrl = null;
+    let formatWorker;
+    let pendingFormat = null;
+    
+    const JSON_VIEW_LIMIT = 200000;
+    const JSON_CHUNK_SIZE = 32768;
+    const TEXT_VIEW_LIMIT = 100000;
+    const DOWNLOAD_LIMIT = 10 * 1024 * 1024;
+    const WORKER_MIN_SIZE = 10000;
+    const HTML_TEXT_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;' };
     
     function initHeaders() {
         requestHeaders = [];
@@ -850,18 +926,58 @@ def get_tester_html() -> tuple[str, str, str]:
     }
     
     async function loadEndpoints() {
+        // Show the last known list immediately, then revalidate it by ETag
+        const cacheKey = 'jec:endpoints:' + API_BASE;
+        const cached = sessionStorage.getItem(cacheKey);
+        const cachedEtag = sessionStorage.getItem(cacheKey + ':etag');
+        if (cached) {
+            endpoints = JSON.parse(cached);
+            showEndpoints();
+        }
+        
         try {
-            const res = await fetch(API_BASE + '/api/endpoints');
-            endpoints = await res.json();
-            renderEndpoints();
+            const headers = cached && cachedEtag ? { 'If-None-Match': cachedEtag } : {};
+            const res = await fetch(API_BASE + '/api/endpoints', { headers });
+            if (res.status === 304) return;
+            const text = await res.text();
+            endpoints = JSON.parse(text);
+            showEndpoints();
+            
+            try {
+                sessionStorage.setItem(cacheKey, text);
+                const etag = res.headers.get('etag');
+                if (etag) sessionStorage.setItem(cacheKey + ':etag', etag);
+            } catch (e) {
+                // Storage full or disabled; the list still works uncached
+            }
         } catch (e) {
             console.error('Failed to load endpoints', e);
         }
     }
     
+    function showEndpoints() {
+        if (selectedEndpoint) {
+            const { method, path } = selectedEndpoint;
+            selectedEndpoint = endpoints.find(e => e.method === method && e.path === path) || null;
+        }
+        buildEndpointList();
+        renderEndpoints(document.getElementById('endpoint-search').value.toLowerCase());
+    }
+    
+    let filterPending = false;
+    let lastFilterQuery = null;
+    
     function filterEndpoints() {
-        const query = document.getElementById('endpoint-search').value.toLowerCase();
-        renderEndpoints(query);
+        // Coalesce bursts of keystrokes into a single render per frame
+        if (filterPending) return;
+        filterPending = true;
+        requestAnimationFrame(() => {
+            filterPending = false;
+            const query = document.getElementById('endpoint-search').value.toLowerCase();
+            if (query === lastFilterQuery) return;
+            lastFilterQuery = query;
+            renderEndpoints(query);
+        });
     }
     
     function groupEndpoints(filtered) {
@@ -880,49 +996,90 @@ def get_tester_html() -> tuple[str, str, str]:
         return Object.values(groups);
     }
     
-    function renderEndpoints(query = '') {
+    function buildEndpointList() {
+        // Build every group and endpoint node once; filtering and selection
+        // then only toggle classes instead of re-rendering the list HTML.
         const list = document.getElementById('endpoint-list');
-        const filtered = endpoints.filter(e => 
-            e.path.toLowerCase().includes(query) || e.method.toLowerCase().includes(query)
-        );
+        endpointGroups = groupEndpoints(endpoints);
+        list.textContent = '';
+        for (const g of endpointGroups) {
+            g.node = buildGroupNode(g);
+            list.appendChild(g.node);
+        }
+    }
+    
+    function buildGroupNode(g) {
+        const node = document.createElement('div');
+        node.className = 'endpoint-group';
+        node.dataset.path = g.path;
+        node.innerHTML = `
+            <div class="endpoint-group-header">
+                <svg class="endpoint-group-chevron" viewBox="0 0 24 24">
+                    <polyline points="9 18 15 12 9 6"></polyline>
+                </svg>
+                <span class="endpoint-group-path">${escapeHtml(g.path)}</span>
+                <span class="endpoint-group-methods"></span>
+                <span class="endpoint-group-count"></span>
+            </div>
+            <div class="endpoint-group-items"></div>
+        `;
+        node.querySelector('.endpoint-group-header').onclick = () => toggleGroup(g.path);
         
-        const groups = groupEndpoints(filtered);
+        const dots = node.querySelector('.endpoint-group-methods');
+        g.dotNodes = {};
+        for (const m of g.methods) {
+            const dot = document.createElement('span');
+            dot.className = `method-dot method-dot-${m}`;
+            dot.title = m;
+            g.dotNodes[m] = dot;
+            dots.appendChild(dot);
+        }
+        g.countNode = node.querySelector('.endpoint-group-count');
         
-        list.innerHTML = groups.map(g => {
-            const isExpanded = expandedGroup === g.path;
-            const methodDots = [...g.methods].map(m => 
-                `<span class="method-dot method-dot-${m}" title="${m}"></span>`
-            ).join('');
+        const items = node.querySelector('.endpoint-group-items');
+        for (const e of g.endpoints) {
+            e._search = `${e.method} ${e.path}`.toLowerCase();
+            e._node = buildEndpointNode(e);
+            items.appendChild(e._node);
+        }
+        return node;
+    }
+    
+    function buildEndpointNode(e) {
+        const node = document.getElementById('endpoint-item-tpl').content.firstElementChild.cloneNode(true);
+        const [method, path] = node.children;
+        method.textContent = e.method;
+        method.classList.add(`method-${e.method}`);
+        path.textContent = e.path;
+        node.onclick = (event) => {
+            event.stopPropagation();
+            selectEndpoint(e.method, e.path);
+        };
+        return node;
+    }
+    
+    function renderEndpoints(query = '') {
+        for (const g of endpointGroups) {
+            let visible = 0;
+            const visibleMethods = new Set();
             
-            const endpointItems = g.endpoints.map(e => {
-                const isActive = selectedEndpoint && 
-                    selectedEndpoint.path === e.path && 
-                    selectedEndpoint.method === e.method;
-                return `
-                    <div class="endpoint-item ${isActive ? 'active' : ''}" 
-                         onclick="event.stopPropagation(); selectEndpoint('${e.method}', '${e.path}')">
-                        <span class="method-badge method-${e.method}">${e.method}</span>
-                        <span class="path">${escapeHtml(e.path)}</span>
-                    </div>
-                `;
-            }).join('');
+            for (const e of g.endpoints) {
+                const match = e._search.includes(query);
+                e._node.classList.toggle('hidden', !match);
+                e._node.classList.toggle('active', match && selectedEndpoint === e);
+                if (match) {
+                    visible++;
+                    visibleMethods.add(e.method);
+                }
+            }
             
-            return `
-                <div class="endpoint-group ${isExpanded ? 'expanded' : ''}" data-path="${g.path}">
-                    <div class="endpoint-group-header" onclick="toggleGroup('${g.path}')">
-                        <svg class="endpoint-group-chevron" viewBox="0 0 24 24">
-                            <polyline points="9 18 15 12 9 6"></polyline>
-                        </svg>
-                        <span class="endpoint-group-path">${escapeHtml(g.path)}</span>
-                        <span class="endpoint-group-methods">${methodDots}</span>
-                        <span class="endpoint-group-count">${g.endpoints.length}</span>
-                    </div>
-                    <div class="endpoint-group-items">
-                        ${endpointItems}
-                    </div>
-                </div>
-            `;
-        }).join('');
+            for (const [m, dot] of Object.entries(g.dotNodes)) {
+                dot.classList.toggle('hidden', !visibleMethods.has(m));
+            }
+            g.countNode.textContent = visible;
+            g.node.classList.toggle('hidden', visible === 0);
+            g.node.classList.toggle('expanded', expandedGroup === g.path);
+        }
     }
     
     function toggleGroup(path) {
@@ -954,6 +1111,8 @@ def get_tester_html() -> tuple[str, str, str]:
         
         resetDefaultBody();
         initHeaders();
+        renderSeq++;
+        releaseDownload();
         document.getElementById('response-viewer').textContent = '';
         document.getElementById('response-status').classList.add('hidden');
         document.getElementById('response-time').classList.add('hidden');
@@ -990,16 +1149,19 @@ def get_tester_html() -> tuple[str, str, str]:
             editor.disabled = false;
             editor.placeholder = 'Enter JSON request body...';
             
-            if (selectedEndpoint.input_schema) {
-                try {
-                    const example = getExampleFromSchema(selectedEndpoint.input_schema);
-                    editor.value = JSON.stringify(example, null, 2);
-                } catch (e) {
-                    editor.value = '{}';
+            // The example only depends on the schema, so build its text once per endpoint
+            if (selectedEndpoint._exampleText === undefined) {
+                let text = '{}';
+                if (selectedEndpoint.input_schema) {
+                    try {
+                        text = JSON.stringify(getExampleFromSchema(selectedEndpoint.input_schema), null, 2);
+                    } catch (e) {
+                        // Keep the empty object
+                    }
                 }
-            } else {
-                editor.value = '{}';
+                selectedEndpoint._exampleText = text;
             }
+            editor.value = selectedEndpoint._exampleText;
         }
     }
     
@@ -1011,6 +1173,8 @@ def get_tester_html() -> tuple[str, str, str]:
         btn.innerHTML = '<span class="loading-spinner"></span><span>Sending...</span>';
         btn.disabled = true;
         
+        renderSeq++;
+        releaseDownload();
         const startTime = performance.now();
         
         try {
@@ -1023,9 +1187,9 @@ def get_tester_html() -> tuple[str, str, str]:
             const editor = document.getElementById('request-editor');
             if (!editor.disabled && editor.value.trim()) {
                 try {
-                    // Try to parse to ensure valid JSON
-                    const body = JSON.parse(editor.value);
-                    options.body = JSON.stringify(body);
+                    // Parse only to validate; the editor text is sent as-is
+                    JSON.parse(editor.value);
+                    options.body = editor.value;
                 } catch (e) {
                     alert('Invalid JSON in request body');
                     btn.innerHTML = originalText;
@@ -1054,15 +1218,19 @@ def get_tester_html() -> tuple[str, str, str]:
             // Check content type
             const contentType = res.headers.get('content-type');
             if (contentType && contentType.includes('application/json')) {
-                const data = await res.json();
-                viewer.innerHTML = formatJson(data);
+                const body = await readBody(res, JSON_VIEW_LIMIT);
+                if (body.complete) {
+                    renderJson(viewer, JSON.parse(body.text));
+                } else {
+                    showDownload(viewer, body.text + `\n… [truncated, ${bodySize(body)} total]`, body);
+                }
             } else {
-                const text = await res.text();
-                // Check if it might be a large blob/binary
-                if (text.length > 100000) {
-                     viewer.textContent = `[Large response: ${text.length} bytes]`;
+                const body = await readBody(res, TEXT_VIEW_LIMIT);
+                // Large blobs/binary are summarized rather than shown
+                if (body.complete) {
+                     viewer.textContent = body.text;
                 } else {
-                     viewer.textContent = text;
+                     showDownload(viewer, `[Large response: ${bodySize(body)}]`, body);
                 }
             }
             
@@ -1077,26 +1245,238 @@ def get_tester_html() -> tuple[str, str, str]:
         }
     }
     
-    function formatJson(data) {
+    async function readBody(res, limit) {
+        // Only the first `limit` bytes are decoded for display; an oversized
+        // body is kept as raw chunks so it can be offered as a download, and
+        // reading stops once DOWNLOAD_LIMIT bytes have been captured.
+        if (!res.body) {
+            const text = await res.text();
+            if (text.length <= limit) return { text, size: text.length, complete: true };
+            return { text: text.slice(0, limit), size: text.length, complete: false, blob: new Blob([text]) };
+        }
+        const reader = res.body.getReader();
+        const chunks = [];
+        let size = 0;
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            chunks.push(value);
+            size += value.length;
+            if (size > DOWNLOAD_LIMIT) {
+                reader.cancel();
+                break;
+            }
+        }
+        const capped = size > DOWNLOAD_LIMIT;
+        
+        const head = new Uint8Array(Math.min(size, limit));
+        let offset = 0;
+        for (const chunk of chunks) {
+            if (offset >= head.length) break;
+            const part = chunk.subarray(0, head.length - offset);
+            head.set(part, offset);
+            offset += part.length;
+        }
+        const text = new TextDecoder().decode(head);
+        if (size <= limit) return { text, size, complete: true };
+        let blob = new Blob(chunks, { type: res.headers.get('content-type') || '' });
+        if (capped) {
+            blob = blob.slice(0, DOWNLOAD_LIMIT, blob.type);
+            size = DOWNLOAD_LIMIT;
+        }
+        return { text, size, complete: false, blob, capped };
+    }
+    
+    function bodySize(body) {
+        return body.capped ? `over ${body.size} bytes` : `${body.size} bytes`;
+    }
+    
+    function showDownload(viewer, summary, body) {
+        // Keep the bytes already downloaded instead of rendering them; a
+        // capped body only offers what was captured before reading stopped
+        downloadUrl = URL.createObjectURL(body.blob);
+        const link = document.createElement('a');
+        link.href = downloadUrl;
+        link.download = 'response';
+        link.textContent = body.capped
+            ? `Download first ${body.blob.size} bytes`
+            : `Download ${body.blob.size} bytes`;
+        viewer.textContent = summary + '\n';
+        viewer.appendChild(link);
+    }
+    
+    function releaseDownload() {
+        if (downloadUrl) {
+            URL.revokeObjectURL(downloadUrl);
+            downloadUrl = null;
+        }
+    }
+    
+    function renderJson(viewer, data) {
         const json = JSON.stringify(data, null, 2);
-        return json.replace(/("(\\\\u[a-zA-Z0-9]{4}|\\\\[^u]|[^\\\\"])*"(\s*:)?|\b(true|false|null)\b|-?\d+(?:\.\d*)?(?:[eE][+\-]?\d+)?)/g, function (match) {
-            let cls = 'number';
-            if (/^"/.test(match)) {
-                if (/:$/.test(match)) {
-                    cls = 'key';
-                    match = match.replace(/:$/, '');
-                    return `<span class="${cls}">${escapeHtml(match)}</span>:`; 
-                } else {
-                    cls = 'string';
+        const seq = ++renderSeq;
+        if (json === undefined) {
+            viewer.textContent = '';
+            return;
+        }
+        if (json.length > JSON_VIEW_LIMIT) {
+            viewer.textContent = json.slice(0, JSON_VIEW_LIMIT) + `\n… [truncated, ${json.length} bytes total]`;
+            return;
+        }
+        
+        viewer.textContent = '';
+        if (json.length >= WORKER_MIN_SIZE) {
+            // Tokenize large payloads off the main thread; only inserting
+            // the finished chunks happens here
+            const worker = getFormatWorker();
+            if (worker) {
+                pendingFormat = { seq, json };
+                worker.postMessage(pendingFormat);
+                return;
+            }
+        }
+        appendChunks(viewer, seq, splitJsonChunks(json), formatJson);
+    }
+    
+    function splitJsonChunks(json) {
+        // Line-aligned slices; pretty-printed JSON never splits a token across lines
+        const chunks = [];
+        let pos = 0;
+        while (pos < json.length) {
+            let end = Math.min(pos + JSON_CHUNK_SIZE, json.length);
+            if (end < json.length) {
+                const nl = json.lastIndexOf('\n', end);
+                if (nl > pos) end = nl + 1;
+            }
+            chunks.push(json.slice(pos, end));
+            pos = end;
+        }
+        return chunks;
+    }
+    
+    function appendChunks(viewer, seq, chunks, toHtml) {
+        // Append one chunk per idle period so big payloads don't block the UI
+        const schedule = window.requestIdleCallback || (cb => setTimeout(cb, 0));
+        let i = 0;
+        function step() {
+            if (seq !== renderSeq) return;  // superseded by a newer response
+            viewer.insertAdjacentHTML('beforeend', toHtml(chunks[i++]));
+            if (i < chunks.length) schedule(step);
+        }
+        if (chunks.length) step();
+    }
+    
+    function getFormatWorker() {
+        if (formatWorker !== undefined) return formatWorker;
+        try {
+            const source = [
+                `const JSON_CHUNK_SIZE = ${JSON_CHUNK_SIZE};`,
+                `const HTML_TEXT_ESCAPES = ${JSON.stringify(HTML_TEXT_ESCAPES)};`,
+                splitJsonChunks.toString(),
+                formatJson.toString(),
+                'onmessage = e => postMessage({ seq: e.data.seq, chunks: splitJsonChunks(e.data.json).map(formatJson) });',
+            ].join('\n');
+            const url = URL.createObjectURL(new Blob([source], { type: 'text/javascript' }));
+            formatWorker = new Worker(url);
+            formatWorker.onmessage = e => {
+                if (pendingFormat && pendingFormat.seq === e.data.seq) pendingFormat = null;
+                if (e.data.seq !== renderSeq) return;
+                appendChunks(document.getElementById('response-viewer'), e.data.seq, e.data.chunks, html => html);
+            };
+            formatWorker.onerror = () => {
+                // Load failures (CSP, blocked blob: URLs) only surface here;
+                // stop using the worker and render what it was handed inline
+                formatWorker.terminate();
+                formatWorker = null;
+                const pending = pendingFormat;
+                pendingFormat = null;
+                if (pending && pending.seq === renderSeq) {
+                    appendChunks(document.getElementById('response-viewer'), pending.seq, splitJsonChunks(pending.json), formatJson);
+                }
+            };
+        } catch (e) {
+            // Workers unavailable (e.g. blocked by CSP); highlight inline instead
+            formatWorker = null;
+        }
+        return formatWorker;
+    }
+    
+    function formatJson(json) {
+        // Single pass over pretty-printed JSON text, emitting highlight spans
+        const out = [];
+        const n = json.length;
+        let i = 0;
+        while (i < n) {
+            const c = json.charCodeAt(i);
+            if (c === 34) {  // "
+                let j = i + 1;
+                let markup = false;
+                while (j < n) {
+                    const cc = json.charCodeAt(j);
+                    if (cc === 92) { j += 2; continue; }  // backslash escape
+                    if (cc === 34) break;
+                    if (cc === 38 || cc === 60 || cc === 62) markup = true;  // & < >
+                    j++;
                 }
-            } else if (/true|false/.test(match)) {
-                cls = 'boolean';
-            } else if (/null/.test(match)) {
-                cls = 'null';
+                // Span text only needs & < > escaped, and most tokens contain none
+                let token = json.slice(i, j + 1);
+                if (markup) token = token.replace(/[&<>]/g, ch => HTML_TEXT_ESCAPES[ch]);
+                const cls = json.charCodeAt(j + 1) === 58 ? 'key' : 'string';  // followed by :
+                out.push(`<span class="${cls}">${token}</span>`);
+                i = j + 1;
+            } else if (c === 45 || (c >= 48 && c <= 57)) {  // - or digit
+                let j = i + 1;
+                while (j < n) {
+                    const cc = json.charCodeAt(j);
+                    if (!((cc >= 48 && cc <= 57) || cc === 46 || cc === 43 || cc === 45 || cc === 101 || cc === 69)) break;
+                    j++;
+                }
+                out.push(`<span class="number">${json.slice(i, j)}</span>`);
+                i = j;
+            } else if (c === 116 || c === 102) {  // true / false
+                const len = c === 116 ? 4 : 5;
+                out.push(`<span class="boolean">${json.substr(i, len)}</span>`);
+                i += len;
+            } else if (c === 110) {  // null
+                out.push('<span class="null">null</span>');
+                i += 4;
+            } else {
+                out.push(json[i]);
+                i++;
             }
-            return `<span class="${cls}">${escapeHtml(match)}</span>`;
-        });
+        }
+        return out.join('');
     }
     """
-    
-    return html, css, js
+
+
+_TESTER_ASSETS: tuple[str, str, str] = (_HTML, _CSS, _JS)
+_TESTER_ASSETS_BYTES: tuple[bytes, bytes, bytes] = tuple(part.encode("utf-8") for part in _TESTER_ASSETS)
+
+
+def get_tester_html() -> tuple[str, str, str]:
+    """
+    Returns the HTML, CSS, and JS for the endpoint tester component.
+    """
+    return _TESTER_ASSETS
+
+
+def get_tester_html_bytes() -> tuple[bytes, bytes, bytes]:
+    """
+    Returns the tester HTML, CSS, and JS pre-encoded as UTF-8.
+    """
+    return _TESTER_ASSETS_BYTES
+
+
+@functools.lru_cache(maxsize=None)
+def get_tester_assets_gz() -> tuple[tuple[bytes, str], tuple[bytes, str], tuple[bytes, str]]:
+    """
+    Returns the tester HTML, CSS, and JS gzip-compressed, each paired with its media type.
+    Compressed once on first use; serve with `Content-Encoding: gzip`.
+    """
+    html, css, js = _TESTER_ASSETS_BYTES
+    return (
+        (gzip.compress(html, 9), "text/html"),
+        (gzip.compress(css, 9), "text/css"),
+        (gzip.compress(js, 9), "application/javascript"),
+    )
@@ -0,0 +1,654 @@
+import pytest
+from fastapi import Request
+from fastapi.testclient import TestClient
+from jec_api import Core, Route, cache
+from jec_api.decorator.cache import _compute_etag, get_cache_backend, set_cache_backend, MemoryCacheBackend
+
+
+@pytest.fixture(autouse=True)
+def fresh_backend():
+    set_cache_backend(MemoryCacheBackend())
+    yield
+
+
+def test_compute_etag_is_stable():
+    a = _compute_etag(b'{"a":[1,2]}')
+    assert a == _compute_etag(b'{"a":[1,2]}')
+    assert len(a) == 32
+    assert len(_compute_etag(b'{"a":[1,2]}', "sha256")) == 32
+    assert a != _compute_etag(b'{"a":[1,3]}')
+
+
+def test_cache_hit_and_etag():
+    calls = {"count": 0}
+
+    class CachedItems(Route):
+        path = "/cached"
+
+        @cache(ttl=60)
+        async def get(self, request: Request):
+            calls["count"] += 1
+            return {"items": [1, 2, 3]}
+
+    app = Core()
+    app.register(CachedItems)
+    client = TestClient(app)
+
+    first = client.get("/cached")
+    assert first.status_code == 200
+    assert first.json() == {"items": [1, 2, 3]}
+    etag = first.headers["ETag"]
+
+    second = client.get("/cached")
+    assert second.json() == {"items": [1, 2, 3]}
+    assert second.headers["ETag"] == etag
+    assert second.headers["Cache-Control"].startswith("public, max-age=60")
+    assert second.headers["Content-Type"] == "application/json"
+    assert second.content == first.content
+    assert calls["count"] == 1
+
+    assert etag.startswith('"') and etag.endswith('"')
+
+    not_modified = client.get("/cached", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+    assert client.get("/cached", headers={"If-None-Match": f'"other", W/{etag}'}).status_code == 304
+    assert client.get("/cached", headers={"If-None-Match": '"other"'}).status_code == 200
+    assert calls["count"] == 1
+
+
+def test_cache_hit_keeps_endpoint_media_type():
+    from fastapi.responses import JSONResponse
+
+    class ApiJSONResponse(JSONResponse):
+        media_type = "application/vnd.api+json"
+
+    class CachedDoc(Route):
+        path = "/cached-doc"
+
+        @cache(ttl=60)
+        async def get(self, request: Request):
+            return ApiJSONResponse({"data": []})
+
+    app = Core()
+    app.register(CachedDoc)
+    client = TestClient(app)
+
+    first = client.get("/cached-doc")
+    second = client.get("/cached-doc")
+    assert first.headers["Content-Type"] == "application/vnd.api+json"
+    assert second.headers["Content-Type"] == first.headers["Content-Type"]
+    assert second.content == first.content
+
+
+def test_cache_hit_keeps_empty_body():
+    from fastapi.responses import JSONResponse
+
+    class EmptyJSONResponse(JSONResponse):
+        def render(self, content) -> bytes:
+            return b""
+
+    class CachedEmpty(Route):
+        path = "/cached-empty"
+
+        @cache(ttl=60)
+        async def get(self, request: Request):
+            return EmptyJSONResponse(None)
+
+    app = Core()
+    app.register(CachedEmpty)
+    client = TestClient(app)
+
+    first = client.get("/cached-empty")
+    second = client.get("/cached-empty")
+    assert first.content == b""
+    assert second.content == b""
+    assert second.headers["ETag"] == first.headers["ETag"]
+
+
+def test_cache_rejects_unknown_etag_hash():
+    with pytest.raises(ValueError):
+        cache(ttl=10, etag_hash="md5")
+
+
+def test_cache_key_template_uses_only_referenced_fields():
+    class TenantItems(Route):
+        path = "/tenant-items"
+
+        @cache(ttl=60, key="items:{path}:{h_x_tenant}")
+        async def get(self, request: Request):
+            return {"tenant": request.headers.get("X-Tenant")}
+
+    app = Core()
+    app.register(TenantItems)
+    client = TestClient(app)
+
+    assert client.get("/tenant-items", headers={"X-Tenant": "a"}).json() == {"tenant": "a"}
+    assert client.get("/tenant-items", headers={"X-Tenant": "b"}).json() == {"tenant": "b"}
+    assert get_cache_backend().get("items:/tenant-items:a") is not None
+    assert get_cache_backend().get("items:/tenant-items:b") is not None
+
+
+def test_default_key_varies_by_query_and_supports_path_invalidation():
+    from jec_api import cache_invalidate
+
+    calls = {"count": 0}
+
+    class Search(Route):
+        path = "/search"
+
+        @cache(ttl=60)
+        async def get(self, request: Request):
+            calls["count"] += 1
+            return {"q": request.query_params.get("q")}
+
+    app = Core()
+    app.register(Search)
+    client = TestClient(app)
+
+    assert client.get("/search?q=a&page=1").json() == {"q": "a"}
+    assert client.get("/search?page=1&q=a").json() == {"q": "a"}
+    assert client.get("/search?q=b").json() == {"q": "b"}
+    assert calls["count"] == 2
+
+    assert cache_invalidate("GET|/search|*") == 2
+    client.get("/search?q=a&page=1")
+    assert calls["count"] == 3
+
+
+def _entry(expires_in: float = 60.0):
+    import time
+    from jec_api.decorator.cache import CacheEntry
+
+    now = time.time()
+    return CacheEntry(
+        value={"ok": True},
+        status_code=200,
+        content_type="application/json",
+        headers={},
+        expires_at=now + expires_in,
+        stale_until=now + expires_in,
+        etag="etag",
+    )
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(maxsize=2)
+    backend.set("a", _entry())
+    backend.set("b", _entry())
+    assert backend.get("a") is not None
+    backend.set("c", _entry())
+
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.get("c") is not None
+
+
+def test_memory_backend_drops_expired_entries():
+    backend = MemoryCacheBackend()
+    backend.set("old", _entry(expires_in=-1))
+    backend.set("new", _entry())
+    assert backend.get("old") is None
+    assert backend.get("new") is not None
+
+
+def test_memory_backend_invalidate_by_pattern():
+    backend = MemoryCacheBackend()
+    for key in ("users:1", "users:2", "userstats", "orders:1"):
+        backend.set(key, _entry())
+
+    assert backend.invalidate("users:*") == 2
+    assert backend.get("users:1") is None
+    assert backend.get("userstats") is not None
+    assert backend.invalidate("*:1") == 1
+    assert backend.get("orders:1") is None
+
+
+def test_auth_handler_type_error_is_not_retried_with_legacy_signature():
+    from jec_api import auth
+
+    calls = {"count": 0}
+
+    async def broken_handler(request: Request, roles=None, scopes=None, require_all=False) -> bool:
+        calls["count"] += 1
+        raise TypeError("bug inside handler")
+
+    class Guarded(Route):
+        path = "/guarded"
+
+        @auth(True)
+        async def get(self):
+            return {"ok": True}
+
+    app = Core()
+    app.set_auth_handler(broken_handler)
+    app.register(Guarded)
+    client = TestClient(app)
+
+    assert client.get("/guarded").status_code == 500
+    assert calls["count"] == 1
+
+
+def test_cache_ttl_zero_returns_endpoint_unwrapped():
+    async def endpoint(self):
+        return {"ok": True}
+
+    decorated = cache(ttl=0)(endpoint)
+    assert decorated is endpoint
+    assert decorated._cache["ttl"] == 0
+
+
+def test_cache_reuses_json_response_body():
+    from fastapi.responses import JSONResponse
+
+    class Rendered(Route):
+        path = "/rendered"
+
+        @cache(ttl=60)
+        async def get(self, request: Request):
+            return JSONResponse(content={"rendered": True}, status_code=203)
+
+    app = Core()
+    app.register(Rendered)
+    client = TestClient(app)
+
+    miss = client.get("/rendered")
+    hit = client.get("/rendered")
+    assert miss.status_code == hit.status_code == 203
+    assert miss.json() == hit.json() == {"rendered": True}
+    assert miss.headers["ETag"] == hit.headers["ETag"]
+
+
+def test_memory_backend_invalidate_prefix():
+    from jec_api import cache_invalidate_prefix
+
+    backend = MemoryCacheBackend()
+    set_cache_backend(backend)
+    for key in ("a*b:1", "a*b:2", "a*c:1"):
+        backend.set(key, _entry())
+
+    assert cache_invalidate_prefix("a*b:") == 2
+    assert backend.get("a*b:1") is None
+    assert backend.get("a*c:1") is not None
+    assert backend.invalidate("*") == 1
+
+
+def test_deprecated_logs_once_per_process(caplog):
+    import logging
+    from jec_api import deprecated
+
+    class OldThing(Route):
+        path = "/old-thing"
+
+        @deprecated("Use /new-thing")
+        async def get(self):
+            return {"ok": True}
+
+    app = Core()
+    app.register(OldThing)
+    client = TestClient(app)
+
+    with caplog.at_level(logging.WARNING, logger="jec_api"):
+        for _ in range(3):
+            assert client.get("/old-thing").status_code == 200
+
+    assert sum("[DEPRECATED]" in r.getMessage() for r in caplog.records) == 1
+
+
+def test_deprecated_sample_rate(monkeypatch, caplog):
+    import logging
+    import random
+    from jec_api import deprecated
+
+    for bad in (-0.1, 1.5, 5, float("nan")):
+        with pytest.raises(ValueError):
+            deprecated(sample_rate=bad)
+
+    @deprecated(sample_rate=0.25)
+    def endpoint():
+        return {"ok": True}
+
+    rolls = iter([0.1, 0.9, 0.24, 0.25])
+    monkeypatch.setattr(random, "random", lambda: next(rolls))
+    with caplog.at_level(logging.WARNING, logger="jec_api"):
+        for _ in range(4):
+            endpoint()
+
+    # Sampled in below the rate (0.1, 0.24), sampled out at or above it (0.9, 0.25)
+    assert sum("[DEPRECATED]" in r.getMessage() for r in caplog.records) == 2
+
+
+def test_ratelimit_token_bucket_refills():
+    import time
+    from jec_api import ratelimit
+
+    class Bursty(Route):
+        path = "/bursty"
+
+        @ratelimit(limit=2, window=0.2, by="global")
+        async def get(self, request: Request):
+            return {"ok": True}
+
+    app = Core()
+    app.register(Bursty)
+    client = TestClient(app)
+
+    assert client.get("/bursty").status_code == 200
+    assert client.get("/bursty").status_code == 200
+    denied = client.get("/bursty")
+    assert denied.status_code == 429
+    assert denied.headers["Retry-After"] == "1"
+
+    time.sleep(0.15)
+    assert client.get("/bursty").status_code == 200
+
+
+def test_ratelimit_sliding_window_strategy():
+    from jec_api import ratelimit
+
+    with pytest.raises(ValueError):
+        ratelimit(strategy="leaky")
+
+    class Windowed(Route):
+        path = "/windowed"
+
+        @ratelimit(limit=2, window=60, by="global", strategy="sliding_window")
+        async def get(self, request: Request):
+            return {"ok": True}
+
+    app = Core()
+    app.register(Windowed)
+    client = TestClient(app)
+
+    assert client.get("/windowed").status_code == 200
+    assert client.get("/windowed").status_code == 200
+    denied = client.get("/windowed")
+    assert denied.status_code == 429
+    assert 0 < int(denied.headers["Retry-After"]) <= 61
+    assert denied.headers["Content-Type"] == "application/json"
+    assert denied.json()["retry_after"] == int(denied.headers["X-RateLimit-Reset"])
+
+
+def test_log_skips_formatting_when_disabled(monkeypatch):
+    import importlib
+    from jec_api import log
+
+    log_module = importlib.import_module("jec_api.decorator.log")
+
+    class Loud:
+        def __str__(self):
+            raise AssertionError("result should not be stringified")
+
+    monkeypatch.setattr(log_module, "get_dev_store", lambda: None)
+
+    @log(level="debug")
+    def endpoint(self):
+        return Loud()
+
+    assert isinstance(endpoint(object()), Loud)
+
+
+def test_log_keeps_every_short_kwarg(caplog):
+    import logging
+    from jec_api import log
+
+    @log
+    def endpoint(**kwargs):
+        return None
+
+    with caplog.at_level(logging.INFO, logger="jec_api"):
+        endpoint(a=1, b=2, c=3, d=4, e=5, f=[1, 2, 3, 4, 5, 6, 7])
+
+    assert "kwargs={'a': 1, 'b': 2, 'c': 3, 'd': 4, 'e': 5, 'f': [1, 2, 3, 4, 5, 6, 7]}" in caplog.text
+
+
+def test_token_bucket_refills_under_fast_polling(monkeypatch):
+    import importlib
+
+    ratelimit = importlib.import_module("jec_api.decorator.ratelimit")
+    clock = {"now": 10**12}
+    monkeypatch.setattr(ratelimit, "_monotonic_ns", lambda: clock["now"])
+    capacity, window_ns = 10 * ratelimit._TOKEN_SCALE, 60 * 10**9
+
+    key = "fast-poller"
+    for _ in range(10):
+        assert ratelimit._check_token_bucket(capacity, window_ns, key)[0]
+
+    # One millitoken takes 6ms at 10/60s; poll every 5ms for a full window
+    allowed = 0
+    for _ in range(12000):
+        clock["now"] += 5 * 10**6
+        allowed += ratelimit._check_token_bucket(capacity, window_ns, key)[0]
+    assert allowed == 10
+
+
+def test_ratelimit_sweeps_idle_keys():
+    from collections import deque
+    from jec_api.decorator.ratelimit import _sweep_idle_buckets, _sweep_idle_windows
+
+    buckets = {"idle": [0, 0, 10], "busy": [0, 95, 10]}
+    _sweep_idle_buckets(buckets, now_ns=100)
+    assert list(buckets) == ["busy"]
+
+    windows = {"idle": [deque([1]), 5], "empty": [deque(), 5], "busy": [deque([8]), 5]}
+    _sweep_idle_windows(windows, now_ns=10)
+    assert list(windows) == ["busy"]
+
+
+def test_retry_single_attempt_calls_through():
+    from jec_api import retry
+
+    calls = {"count": 0}
+
+    @retry(attempts=1, delay=0)
+    def flaky(self):
+        calls["count"] += 1
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        flaky(object())
+    assert calls["count"] == 1
+    assert flaky._retry.attempts == 1
+
+
+def test_request_finder_uses_signature_position():
+    from jec_api.decorator.utils import request_finder
+
+    class FakeRequest:
+        app = None
+        headers = {}
+
+    def endpoint(self, req: "Request", limit: int = 10):
+        return None
+
+    find = request_finder(endpoint)
+    req = FakeRequest()
+    assert find((object(), req), {}) is req
+    assert find((object(),), {"req": req}) is req
+    assert find((object(),), {"other": 1}) is None
+    assert request_finder(lambda self: None)((object(), req), {}) is req
+
+
+def test_version_constraint_parsing():
+    from jec_api.decorator.version import _parse_constraint
+
+    assert _parse_constraint(">=1.0.0") == (">=", "1.0.0")
+    assert _parse_constraint(" < 2 ") == ("<", "2")
+    assert _parse_constraint("1.5") == ("==", "1.5")
+    for bad in ("", ">=", "v1", "=1"):
+        with pytest.raises(ValueError):
+            _parse_constraint(bad)
+
+
+def test_dev_endpoints_revalidate_with_etag():
+    class Listed(Route):
+        path = "/listed"
+
+        async def get(self):
+            return {"ok": True}
+
+    app = Core()
+    app.register(Listed)
+    app.tinker(dev=True)
+    client = TestClient(app)
+
+    first = client.get("/__dev__/api/endpoints")
+    assert first.status_code == 200
+    assert first.json()[0]["path"] == "/listed"
+    etag = first.headers["ETag"]
+
+    assert client.get("/__dev__/api/endpoints", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/__dev__/api/endpoints", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_dev_console_respects_refused_encodings():
+    app = Core()
+    app.tinker(dev=True)
+    client = TestClient(app)
+
+    def encoding(accept):
+        response = client.get("/__dev__/", headers={"Accept-Encoding": accept})
+        assert response.status_code == 200
+        return response.headers.get("Content-Encoding")
+
+    assert encoding("gzip") == "gzip"
+    assert encoding("br;q=0, gzip") == "gzip"
+    assert encoding("gzip;q=0") is None
+    assert encoding("br;q=0, gzip; q=0.0") is None
+
+
+def test_dev_console_serves_linked_tester_assets():
+    import re
+    from jec_api.dev.dev_endpoint_tester import get_tester_html_bytes
+
+    app = Core()
+    app.tinker(dev=True)
+    client = TestClient(app)
+
+    page = client.get("/__dev__/").text
+    css_url = re.search(r'href="(/__dev__/assets/tester\.css\?v=\w+)"', page).group(1)
+    js_url = re.search(r'src="(/__dev__/assets/tester\.js\?v=\w+)"', page).group(1)
+
+    _, css, js = get_tester_html_bytes()
+    assert client.get(css_url).content == css
+    assert client.get(js_url).content == js
+    assert "immutable" in client.get(js_url).headers["Cache-Control"]
+    assert client.get(js_url, headers={"Accept-Encoding": "gzip"}).headers["Content-Encoding"] == "gzip"
+    assert "Content-Encoding" not in client.get(js_url, headers={"Accept-Encoding": "identity"}).headers
+    assert client.get("/__dev__/assets/missing.js").status_code == 404
+
+
+def test_dev_store_only_records_once_console_is_mounted(monkeypatch):
+    from jec_api import get_store, version
+    from jec_api.decorator import utils
+
+    monkeypatch.setattr(utils, "_dev_store_enabled", False)
+    get_store().clear()
+
+    class Versioned(Route):
+        path = "/versioned"
+
+        @version(">=1.0.0")
+        async def get(self):
+            return {"ok": True}
+
+    app = Core()
+    app.register(Versioned)
+    client = TestClient(app)
+
+    assert client.get("/versioned", headers={"X-API-Version": "1.2.0"}).status_code == 200
+    assert len(get_store().version_checks) == 0
+
+    dev_app = Core()
+    dev_app.register(Versioned)
+    dev_app.tinker(dev=True)
+    assert TestClient(dev_app).get("/versioned", headers={"X-API-Version": "1.2.0"}).status_code == 200
+    assert len(get_store().version_checks) == 1
+
+
+def test_endpoint_schema_handles_unhashable_hints():
+    from dataclasses import dataclass
+    from typing import Annotated
+    from jec_api.dev.dev_endpoint_tester import extract_endpoint_schema
+
+    @dataclass
+    class Payload:
+        count: int
+        tagged: Annotated[int, {"unit": "ms"}]
+
+    schema = extract_endpoint_schema(Payload)
+    assert schema["properties"]["count"] == {"type": "integer"}
+    assert schema["required"] == ["count", "tagged"]
+    assert extract_endpoint_schema(Payload) is schema
+
+
+def test_dev_entries_to_dict_matches_asdict():
+    from dataclasses import asdict
+    from datetime import datetime
+    from jec_api.dev.dev_console import LogEntry, RequestLog, SpeedMetric, VersionCheck
+
+    ts = 1700000000.25
+    entries = (
+        RequestLog(1, ts, "GET", "/", 200, 1.5, "127.0.0.1", {"a": "b"}, {"q": "1"}),
+        LogEntry(2, ts, "info", "fn", "msg", args="()", result="1"),
+        SpeedMetric(3, ts, "fn", 2.5, path="/p"),
+        VersionCheck(4, ts, "fn", ">=1.0", "1.2", True),
+    )
+    for entry in entries:
+        expected = asdict(entry)
+        expected["id"] = f"{entry.id:08d}"
+        expected["timestamp"] = datetime.fromtimestamp(ts).isoformat()
+        assert entry.to_dict() == expected
+
+
+def test_dev_store_get_all_is_cached_until_next_write():
+    from jec_api.dev.dev_console import DevConsoleStore
+
+    store = DevConsoleStore()
+    store.clear()
+    first = store.get_all()
+    assert store.get_all() is first
+
+    store.add_log("info", "fn", "msg")
+    second = store.get_all()
+    assert second is not first
+    assert [l["message"] for l in second["logs"]] == ["msg"]
+
+    store.clear()
+    assert store.get_all()["logs"] == []
+
+
+def test_dev_store_drops_subscriber_whose_loop_closed():
+    import asyncio
+    import threading
+    from jec_api.dev.dev_console import DevConsoleStore
+
+    store = DevConsoleStore()
+
+    async def subscribe():
+        return store.subscribe()
+
+    subscriber = asyncio.run(subscribe())
+    errors = []
+
+    def record():
+        try:
+            store.add_log("info", "fn", "msg")
+        except Exception as exc:
+            errors.append(exc)
+
+    worker = threading.Thread(target=record)
+    worker.start()
+    worker.join()
+
+    assert errors == []
+    assert subscriber not in store._subscribers
+
+
+def test_dev_timestamps_match_isoformat():
+    from datetime import datetime
+    from jec_api.dev.dev_console import _format_timestamp
+
+    for ts in (1700000000.0, 1700000000.9999996, 1700000000.1234565, 1700000001.5):
+        assert _format_timestamp(ts) == datetime.fromtimestamp(ts).isoformat()
+    assert "." not in _format_timestamp(1700000000.0)